@@ -12,10 +12,40 @@ Functions:
 """
 
 import pandas as pd
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Union
 
+# Accepted labels for the pre-enriched classification columns
+VALID_SENTIMENTS = frozenset({'positive', 'negative', 'neutral'})
+VALID_STRATEGIC_GOALS = frozenset({
+    'Growth', 'Trust&Safety', 'Onchain Adoption',
+    'CX Efficiency', 'Compliance'
+})
 
-def get_sentiment(record: pd.Series) -> str:
+
+# The label columns hold a handful of distinct strings, so the string clean-up
+# below is memoized per value; missing values are handled before the lookup.
+@lru_cache(maxsize=1024)
+def _clean_sentiment(value: str) -> str:
+    """Normalize a raw sentiment string, defaulting unexpected values to 'neutral'."""
+    sentiment_str = value.lower().strip()
+    return sentiment_str if sentiment_str in VALID_SENTIMENTS else 'neutral'
+
+
+@lru_cache(maxsize=1024)
+def _clean_theme(value: str) -> str:
+    """Strip a raw theme string, defaulting empty themes to 'General Feedback'."""
+    return value.strip() or 'General Feedback'
+
+
+@lru_cache(maxsize=1024)
+def _clean_strategic_goal(value: str) -> str:
+    """Normalize a raw strategic goal, defaulting unexpected values to 'General'."""
+    goal_str = value.strip()
+    return goal_str if goal_str in VALID_STRATEGIC_GOALS else 'General'
+
+
+def get_sentiment(record: Union[pd.Series, Mapping[str, Any]]) -> str:
     """
     Extract sentiment classification from a feedback record.
     
@@ -23,7 +53,8 @@ def get_sentiment(record: pd.Series) -> str:
     Future enhancement will integrate with actual NLP sentiment analysis models.
     
     Args:
-        record (pd.Series): A single row from the feedback DataFrame
+        record (pd.Series or Mapping): A single row from the feedback DataFrame,
+            either as a Series or as a plain dict (e.g. ``row.to_dict()``)
         
     Returns:
         str: Sentiment classification ('positive', 'negative', 'neutral')
@@ -37,22 +68,14 @@ def get_sentiment(record: pd.Series) -> str:
             return 'neutral'
             
         # Normalize sentiment value to lowercase and validate
-        sentiment_str = str(sentiment).lower().strip()
-        
-        # Validate against expected sentiment values
-        valid_sentiments = {'positive', 'negative', 'neutral'}
-        if sentiment_str in valid_sentiments:
-            return sentiment_str
-        else:
-            # Handle unexpected sentiment values
-            return 'neutral'
+        return _clean_sentiment(str(sentiment))
             
     except (KeyError, AttributeError, TypeError):
         # Return default value if any error occurs
         return 'neutral'
 
 
-def get_theme(record: pd.Series) -> str:
+def get_theme(record: Union[pd.Series, Mapping[str, Any]]) -> str:
     """
     Extract theme categorization from a feedback record.
     
@@ -60,7 +83,8 @@ def get_theme(record: pd.Series) -> str:
     Future enhancement will integrate with actual NLP theme classification models.
     
     Args:
-        record (pd.Series): A single row from the feedback DataFrame
+        record (pd.Series or Mapping): A single row from the feedback DataFrame,
+            either as a Series or as a plain dict (e.g. ``row.to_dict()``)
         
     Returns:
         str: Theme category (e.g., 'Trading/Execution & Fees', 'Performance/Outages')
@@ -73,21 +97,15 @@ def get_theme(record: pd.Series) -> str:
         if pd.isna(theme) or theme is None:
             return 'General Feedback'
             
-        # Return theme as string, handling any data type conversion
-        theme_str = str(theme).strip()
-        
-        # Return empty themes as default
-        if not theme_str:
-            return 'General Feedback'
-            
-        return theme_str
+        # Return theme as string, defaulting empty themes
+        return _clean_theme(str(theme))
         
     except (KeyError, AttributeError, TypeError):
         # Return default value if any error occurs
         return 'General Feedback'
 
 
-def get_strategic_goal(record: pd.Series) -> str:
+def get_strategic_goal(record: Union[pd.Series, Mapping[str, Any]]) -> str:
     """
     Extract strategic goal alignment from a feedback record.
     
@@ -95,7 +113,8 @@ def get_strategic_goal(record: pd.Series) -> str:
     Future enhancement will integrate with actual NLP strategic alignment models.
     
     Args:
-        record (pd.Series): A single row from the feedback DataFrame
+        record (pd.Series or Mapping): A single row from the feedback DataFrame,
+            either as a Series or as a plain dict (e.g. ``row.to_dict()``)
         
     Returns:
         str: Strategic goal alignment ('Growth', 'Trust&Safety', 'Onchain Adoption', 
@@ -110,19 +129,7 @@ def get_strategic_goal(record: pd.Series) -> str:
             return 'General'
             
         # Normalize strategic goal value and validate
-        goal_str = str(strategic_goal).strip()
-        
-        # Validate against expected strategic goals
-        valid_goals = {
-            'Growth', 'Trust&Safety', 'Onchain Adoption', 
-            'CX Efficiency', 'Compliance'
-        }
-        
-        if goal_str in valid_goals:
-            return goal_str
-        else:
-            # Handle unexpected strategic goal values
-            return 'General'
+        return _clean_strategic_goal(str(strategic_goal))
             
     except (KeyError, AttributeError, TypeError):
         # Return default value if any error occurs
@@ -8,19 +8,33 @@ on business impact, sentiment analysis, and strategic alignment.
 Functions:
     calculate_source_weight: Calculate credibility weight based on source channel
     calculate_impact_score: Calculate business impact score for prioritization
+    calculate_source_weight_vec: Column-wise source weights for a whole DataFrame
+    calculate_impact_score_vec: Column-wise impact scores for a whole DataFrame
     enrich_dataframe_with_scores: Apply scoring to entire DataFrame
 """
 
+import numpy as np
 import pandas as pd
-from typing import Optional
+from typing import Any, Mapping, Optional, Union
 import logging
 
+from .nlp_models import VALID_STRATEGIC_GOALS
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Lookup tables shared by the per-row and vectorized scorers
+SENTIMENT_VALUES = {
+    'negative': 1.5,
+    'neutral': 0.5,
+    'positive': 0.1
+}
+# Every recognised strategic goal is aligned and gets the 2.0 multiplier
+ALIGNED_GOALS = VALID_STRATEGIC_GOALS
+
 
-def calculate_source_weight(record: pd.Series) -> float:
+def calculate_source_weight(record: Union[pd.Series, Mapping[str, Any]]) -> float:
     """
     Calculate source credibility weight based on channel-specific logic.
     
@@ -31,7 +45,8 @@ def calculate_source_weight(record: pd.Series) -> float:
     - Default: 1.0
     
     Args:
-        record (pd.Series): A single row from the feedback DataFrame
+        record (pd.Series or Mapping): A single row from the feedback DataFrame,
+            either as a Series or as a plain dict (e.g. ``row.to_dict()``)
         
     Returns:
         float: Source weight value (minimum 0.1, default 1.0)
@@ -98,7 +113,7 @@ def calculate_source_weight(record: pd.Series) -> float:
         return 1.0
 
 
-def calculate_impact_score(record: pd.Series, source_weight: Optional[float] = None) -> float:
+def calculate_impact_score(record: Union[pd.Series, Mapping[str, Any]], source_weight: Optional[float] = None) -> float:
     """
     Calculate business impact score combining sentiment, severity, source weight, and strategic alignment.
     
@@ -108,7 +123,8 @@ def calculate_impact_score(record: pd.Series, source_weight: Optional[float] = N
     Strategic multiplier: aligned goals=2.0, others=1.0
     
     Args:
-        record (pd.Series): A single row from the feedback DataFrame
+        record (pd.Series or Mapping): A single row from the feedback DataFrame,
+            either as a Series or as a plain dict (e.g. ``row.to_dict()``)
         source_weight (Optional[float]): Pre-calculated source weight (will calculate if None)
         
     Returns:
@@ -123,12 +139,7 @@ def calculate_impact_score(record: pd.Series, source_weight: Optional[float] = N
             sentiment = 'neutral'
         
         sentiment_str = str(sentiment).lower().strip()
-        sentiment_values = {
-            'negative': 1.5,
-            'neutral': 0.5,
-            'positive': 0.1
-        }
-        sentiment_value = sentiment_values.get(sentiment_str, 0.5)
+        sentiment_value = SENTIMENT_VALUES.get(sentiment_str, 0.5)
         
         # Get severity
         severity = record.get('severity', 1.0)
@@ -151,14 +162,7 @@ def calculate_impact_score(record: pd.Series, source_weight: Optional[float] = N
             strategic_goal = ''
         
         strategic_goal_str = str(strategic_goal).strip()
-        
-        # Define aligned strategic goals (these get 2.0 multiplier)
-        aligned_goals = {
-            'Growth', 'Trust&Safety', 'Onchain Adoption', 
-            'CX Efficiency', 'Compliance'
-        }
-        
-        strategic_multiplier = 2.0 if strategic_goal_str in aligned_goals else 1.0
+        strategic_multiplier = 2.0 if strategic_goal_str in ALIGNED_GOALS else 1.0
         
         # Calculate final impact score
         impact_score = (sentiment_value * severity) * source_weight * strategic_multiplier
@@ -170,6 +174,111 @@ def calculate_impact_score(record: pd.Series, source_weight: Optional[float] = N
         return 0.0
 
 
+def _numeric_column(df: pd.DataFrame, column: str, default: float):
+    """
+    Coerce a column to floats the way the row-wise scorers do.
+    
+    Missing columns and null cells take the default value. Cells that are
+    present but cannot be parsed as numbers are flagged as invalid.
+    
+    Returns:
+        tuple: (float ndarray of values, boolean ndarray of invalid cells)
+    """
+    if column not in df.columns:
+        return np.full(len(df), default, dtype=float), np.zeros(len(df), dtype=bool)
+    
+    raw = df[column]
+    missing = raw.isna().to_numpy()
+    values = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    invalid = np.isnan(values) & ~missing
+    return np.where(missing | invalid, default, values), invalid
+
+
+def calculate_source_weight_vec(df: pd.DataFrame) -> np.ndarray:
+    """
+    Calculate source weights for every row of a DataFrame at once.
+    
+    Column-wise equivalent of calculate_source_weight, applying the same
+    channel formulas, minimum weight and fallbacks.
+    
+    Args:
+        df (pd.DataFrame): Feedback DataFrame
+        
+    Returns:
+        np.ndarray: Source weight for each row
+    """
+    source = pd.Series('', index=df.index, dtype=object)
+    if 'source' in df.columns:
+        # .str yields NaN for non-string sources, which fail .lower() in the
+        # row-wise version and get the default weight
+        try:
+            source = df['source'].str.lower().fillna('')
+        except AttributeError:
+            pass
+    
+    is_sales = source.str.contains('sales', regex=False).to_numpy(dtype=bool)
+    is_twitter = (
+        source.str.contains('twitter', regex=False) | source.str.contains('x', regex=False)
+    ).to_numpy(dtype=bool)
+    is_app_store = source.str.contains(
+        'app store|ios|google play|android', regex=True
+    ).to_numpy(dtype=bool)
+    
+    arr_impact, arr_invalid = _numeric_column(df, 'ARR_impact_estimate_USD', 0.0)
+    followers, followers_invalid = _numeric_column(df, 'followers', 0.0)
+    rating, rating_invalid = _numeric_column(df, 'rating', 0.0)
+    helpful_votes, votes_invalid = _numeric_column(df, 'helpful_votes', 0.0)
+    
+    sales_weight = np.where(arr_invalid, 1.0, np.maximum(arr_impact / 50000, 0.1))
+    twitter_weight = np.where(followers_invalid, 1.0, np.maximum(followers / 20000, 0.1))
+    app_store_weight = np.where(
+        rating_invalid | votes_invalid, 1.0, np.maximum(rating + helpful_votes / 10, 0.1)
+    )
+    
+    return np.select(
+        [is_sales, is_twitter, is_app_store],
+        [sales_weight, twitter_weight, app_store_weight],
+        default=1.0
+    )
+
+
+def calculate_impact_score_vec(df: pd.DataFrame, source_weight: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate impact scores for every row of a DataFrame at once.
+    
+    Column-wise equivalent of calculate_impact_score:
+    (sentiment_value × severity) × source_weight × strategic_multiplier
+    
+    Args:
+        df (pd.DataFrame): Feedback DataFrame
+        source_weight (Optional[np.ndarray]): Pre-calculated source weights (will calculate if None)
+        
+    Returns:
+        np.ndarray: Impact score for each row, rounded to 4 decimals
+    """
+    if source_weight is None:
+        source_weight = calculate_source_weight_vec(df)
+    
+    if 'sentiment' in df.columns:
+        sentiment = df['sentiment'].astype('string').str.lower().str.strip()
+        sentiment_value = sentiment.map(SENTIMENT_VALUES).to_numpy(dtype=float, na_value=0.5)
+    else:
+        sentiment_value = np.full(len(df), 0.5)
+    
+    severity, _ = _numeric_column(df, 'severity', 1.0)
+    
+    if 'strategic_goal' in df.columns:
+        strategic_goal = df['strategic_goal'].astype('string').str.strip()
+        aligned = strategic_goal.isin(ALIGNED_GOALS).to_numpy(dtype=bool)
+    else:
+        aligned = np.zeros(len(df), dtype=bool)
+    strategic_multiplier = np.where(aligned, 2.0, 1.0)
+    
+    impact_score = (sentiment_value * severity) * np.asarray(source_weight, dtype=float) * strategic_multiplier
+    
+    return np.round(impact_score, 4)
+
+
 def enrich_dataframe_with_scores(df: pd.DataFrame) -> pd.DataFrame:
     """
     Apply source weighting and impact scoring to all records in a DataFrame.
@@ -192,13 +301,11 @@ def enrich_dataframe_with_scores(df: pd.DataFrame) -> pd.DataFrame:
     enriched_df = df.copy()
     
     # Calculate source weights for all rows
-    enriched_df['source_weight'] = enriched_df.apply(calculate_source_weight, axis=1)
+    source_weight = calculate_source_weight_vec(enriched_df)
+    enriched_df['source_weight'] = source_weight
     
     # Calculate impact scores using the calculated source weights
-    def calculate_impact_with_weight(row):
-        return calculate_impact_score(row, row['source_weight'])
-    
-    enriched_df['impact_score'] = enriched_df.apply(calculate_impact_with_weight, axis=1)
+    enriched_df['impact_score'] = calculate_impact_score_vec(enriched_df, source_weight)
     
     logger.info(f"Enriched {len(enriched_df)} records with source weights and impact scores")
     
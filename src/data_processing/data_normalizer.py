@@ -5,7 +5,9 @@ This module handles the normalization and unification of data from multiple sour
 into a standardized format for analysis.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import logging
 from typing import Dict, List, Optional
 
@@ -37,12 +39,25 @@ COLUMN_MAPPINGS = {
     }
 }
 
+# Source channel label for each source type
+SOURCE_CHANNEL_MAP = {
+    source_type: mapping['source_channel'] for source_type, mapping in COLUMN_MAPPINGS.items()
+}
+
 # Standard columns that should be present in the unified DataFrame
 STANDARD_COLUMNS = [
     'customer_id', 'source_channel', 'feedback_text', 'author_handle', 
     'timestamp', 'sentiment', 'theme', 'severity', 'strategic_goal'
 ]
 
+# Low-cardinality label columns stored as categoricals in the unified DataFrame
+# (source_channel is built as a categorical separately)
+CATEGORICAL_COLUMNS = ['sentiment', 'theme', 'strategic_goal']
+
+# Hashed lookups used when validating the unified DataFrame
+_REQUIRED_COLUMNS = frozenset(STANDARD_COLUMNS)
+_EXPECTED_CHANNELS = frozenset(SOURCE_CHANNEL_MAP.values())
+
 # Source-specific columns to preserve
 SOURCE_SPECIFIC_COLUMNS = {
     'ios_reviews': ['rating', 'helpful_votes', 'region', 'device', 'app_version'],
@@ -150,16 +165,78 @@ def normalize_single_source(df: pd.DataFrame, source_type: str) -> pd.DataFrame:
     """
     logger.info(f"Starting normalization for {source_type}")
     
-    # Apply all normalization steps
-    df_normalized = df.copy()
-    df_normalized = normalize_feedback_text(df_normalized, source_type)
-    df_normalized = normalize_author_handle(df_normalized, source_type)
-    df_normalized = add_source_channel(df_normalized, source_type)
+    if source_type not in COLUMN_MAPPINGS:
+        logger.error(f"Unknown source type for normalization: {source_type}")
+        return df.copy()
+        
+    mapping = COLUMN_MAPPINGS[source_type]
+    
+    # Collect all normalized columns and add them in a single pass
+    new_columns = {}
+    for target_col in ('feedback_text', 'author_handle'):
+        source_col = mapping[f'{target_col}_source']
+        if source_col in df.columns:
+            new_columns[target_col] = df[source_col]
+        else:
+            logger.error(f"Source column '{source_col}' not found in {source_type} data")
+    new_columns['source_channel'] = SOURCE_CHANNEL_MAP[source_type]
+    
+    df_normalized = df.assign(**new_columns)
     
     logger.info(f"Completed normalization for {source_type}")
     return df_normalized
 
 
+def _concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate normalized DataFrames, chaining Arrow chunks when possible.
+    
+    Args:
+        frames: Normalized DataFrames to combine
+        
+    Returns:
+        Combined DataFrame with a fresh RangeIndex
+    """
+    try:
+        tables = [pa.Table.from_pandas(df, preserve_index=False) for df in frames]
+        combined = pa.concat_tables(tables, promote_options="permissive")
+        # NumPy-backed text may arrive as large_string; store all text as string
+        combined = combined.cast(pa.schema([
+            field.with_type(pa.string()) if pa.types.is_large_string(field.type) else field
+            for field in combined.schema
+        ]))
+        return combined.to_pandas(types_mapper=pd.ArrowDtype)
+    except (pa.ArrowException, TypeError) as e:
+        # Columns Arrow cannot represent (e.g. mixed Python objects) stay in pandas
+        logger.warning(f"Arrow concatenation failed, falling back to pandas: {e}")
+        
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+
+def _source_channel_column(source_types: List[str], lengths: List[int]) -> pd.Categorical:
+    """
+    Build the categorical source_channel column for concatenated sources.
+    
+    Each frame contributes one run of a single channel, so the column is
+    expanded from per-frame category codes in one vectorized step. Only the
+    channels actually present become categories, keeping value_counts free
+    of zero-count entries.
+    
+    Args:
+        source_types: Source type of each concatenated frame, in order (all known)
+        lengths: Row count of each concatenated frame
+        
+    Returns:
+        Categorical aligned with the concatenated rows
+    """
+    channels = list(dict.fromkeys(SOURCE_CHANNEL_MAP[source_type] for source_type in source_types))
+    codes = [channels.index(SOURCE_CHANNEL_MAP[source_type]) for source_type in source_types]
+    return pd.Categorical.from_codes(
+        np.repeat(np.asarray(codes, dtype=np.int8), lengths),
+        dtype=pd.CategoricalDtype(channels)
+    )
+
+
 def unify_dataframes(loaded_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """
     Unify multiple normalized DataFrames into a single DataFrame.
@@ -175,6 +252,7 @@ def unify_dataframes(loaded_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         return pd.DataFrame()
         
     normalized_dfs = []
+    source_types = []
     
     # Normalize each source
     for source_type, df in loaded_data.items():
@@ -184,13 +262,29 @@ def unify_dataframes(loaded_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
             
         normalized_df = normalize_single_source(df, source_type)
         normalized_dfs.append(normalized_df)
+        source_types.append(source_type)
         
     if not normalized_dfs:
         logger.error("No valid DataFrames to unify")
         return pd.DataFrame()
         
     # Combine all normalized DataFrames
-    unified_df = pd.concat(normalized_dfs, ignore_index=True, sort=False)
+    unified_df = _concat_frames(normalized_dfs)
+    
+    # Re-derive source_channel as a categorical in one pass over the combined rows
+    if 'source_channel' in unified_df.columns:
+        if all(source_type in SOURCE_CHANNEL_MAP for source_type in source_types):
+            unified_df['source_channel'] = _source_channel_column(
+                source_types, [len(df) for df in normalized_dfs]
+            )
+        else:
+            # Frames of unknown source types keep any source_channel the caller supplied
+            unified_df['source_channel'] = unified_df['source_channel'].astype('category')
+    
+    # Store repeated labels as integer codes; categories are the observed values
+    for col in CATEGORICAL_COLUMNS:
+        if col in unified_df.columns:
+            unified_df[col] = unified_df[col].astype('category')
     
     logger.info(f"Unified {len(normalized_dfs)} sources into DataFrame with {len(unified_df)} total records")
     return unified_df
@@ -211,8 +305,8 @@ def validate_unified_dataframe(df: pd.DataFrame) -> bool:
         return False
         
     # Check for required standard columns
-    missing_columns = [col for col in STANDARD_COLUMNS if col not in df.columns]
-    if missing_columns:
+    if not _REQUIRED_COLUMNS.issubset(df.columns):
+        missing_columns = [col for col in STANDARD_COLUMNS if col not in df.columns]
         logger.error(f"Missing required columns in unified DataFrame: {missing_columns}")
         return False
         
@@ -222,9 +316,7 @@ def validate_unified_dataframe(df: pd.DataFrame) -> bool:
         logger.warning(f"Found {duplicate_count} duplicate customer_ids in unified DataFrame")
         
     # Validate source_channel values
-    expected_channels = set(mapping['source_channel'] for mapping in COLUMN_MAPPINGS.values())
-    actual_channels = set(df['source_channel'].unique())
-    unexpected_channels = actual_channels - expected_channels
+    unexpected_channels = set(df['source_channel'].unique()) - _EXPECTED_CHANNELS
     
     if unexpected_channels:
         logger.warning(f"Unexpected source channels found: {unexpected_channels}")
@@ -252,15 +344,28 @@ def get_normalization_summary(unified_df: pd.DataFrame) -> Dict[str, any]:
             'author_handle_coverage': 0
         }
         
-    # Count records by source
-    source_counts = unified_df['source_channel'].value_counts().to_dict()
+    total_records = len(unified_df.index)
+    
+    # Count records and non-null normalized fields per source in one grouped pass
+    per_source = unified_df.groupby('source_channel', observed=True, sort=False, dropna=False).agg(
+        records=('source_channel', 'size'),
+        feedback_text=('feedback_text', 'count'),
+        author_handle=('author_handle', 'count')
+    )
+    
+    # Record counts by source, largest first (rows without a channel are not a source)
+    source_counts = (
+        per_source['records'][per_source.index.notna()]
+        .sort_values(ascending=False, kind='stable')
+        .to_dict()
+    )
     
     # Calculate coverage for key normalized fields
-    feedback_coverage = (unified_df['feedback_text'].notna().sum() / len(unified_df)) * 100
-    author_coverage = (unified_df['author_handle'].notna().sum() / len(unified_df)) * 100
+    feedback_coverage = (per_source['feedback_text'].sum() / total_records) * 100
+    author_coverage = (per_source['author_handle'].sum() / total_records) * 100
     
     summary = {
-        'total_records': len(unified_df),
+        'total_records': total_records,
         'sources': list(source_counts.keys()),
         'source_counts': source_counts,
         'columns': list(unified_df.columns),
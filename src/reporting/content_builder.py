@@ -41,7 +41,7 @@ def group_by_theme(df: pd.DataFrame) -> pd.DataFrame:
     
     try:
         # Group by theme and calculate aggregations
-        theme_groups = df.groupby('theme').agg({
+        theme_groups = df.groupby('theme', observed=True).agg({
             'impact_score': ['sum', 'mean', 'count'],
             'sentiment': lambda x: (x == 'negative').sum(),  # Count of negative sentiments
             'customer_id': 'nunique'  # Unique customers per theme
@@ -185,7 +185,7 @@ def extract_strategic_insights(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         strategic_insights = {}
         
         # Group by strategic goal
-        strategic_groups = df.groupby('strategic_goal').agg({
+        strategic_groups = df.groupby('strategic_goal', observed=True).agg({
             'impact_score': ['sum', 'mean', 'count'],
             'sentiment': lambda x: {
                 'positive': (x == 'positive').sum(),
@@ -206,8 +206,9 @@ def extract_strategic_insights(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
             avg_impact = goal_data['impact_score'].mean()
             feedback_count = len(goal_data)
             
-            # Sentiment breakdown
-            sentiment_counts = goal_data['sentiment'].value_counts().to_dict()
+            # Sentiment breakdown (skip zero counts left by categorical labels)
+            sentiment_counts = goal_data['sentiment'].value_counts()
+            sentiment_counts = sentiment_counts[sentiment_counts > 0].to_dict()
             
             # Top feedback item for this goal
             top_item = goal_data.nlargest(1, 'impact_score')
@@ -278,7 +279,7 @@ def generate_executive_summary(df: pd.DataFrame) -> Dict[str, Any]:
         max_impact = df['impact_score'].max()
         
         # Top theme by impact
-        theme_impacts = df.groupby('theme')['impact_score'].sum().sort_values(ascending=False)
+        theme_impacts = df.groupby('theme', observed=True)['impact_score'].sum().sort_values(ascending=False)
         top_theme = theme_impacts.index[0] if not theme_impacts.empty else 'Unknown'
         top_theme_impact = theme_impacts.iloc[0] if not theme_impacts.empty else 0
         
@@ -288,8 +289,7 @@ def generate_executive_summary(df: pd.DataFrame) -> Dict[str, Any]:
         # Time range (if timestamp available)
         time_range = {}
         if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-            valid_timestamps = df['timestamp'].dropna()
+            valid_timestamps = pd.to_datetime(df['timestamp'], errors='coerce').dropna()
             if not valid_timestamps.empty:
                 time_range = {
                     'start_date': valid_timestamps.min().strftime('%Y-%m-%d'),
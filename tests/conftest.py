@@ -7,6 +7,7 @@ used across all test modules to ensure consistency and reduce duplication.
 Requirements: 8.1, 8.2, 8.3, 8.4
 """
 
+import io
 import pytest
 import pandas as pd
 import tempfile
@@ -16,6 +17,28 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 
+def pytest_configure(config):
+    """Register the custom markers (pytest.ini uses a header pytest does not read)."""
+    for marker in (
+        "unit: Unit tests",
+        "integration: Integration tests",
+        "e2e: End-to-end tests",
+        "slow: Slow running tests",
+        "performance: Performance tests",
+        "error_scenarios: Error scenario tests",
+    ):
+        config.addinivalue_line("markers", marker)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pandas():
+    """Pay pandas' lazy initialization cost once, before the first test runs."""
+    pd.DataFrame({'a': [1]}).to_csv(io.StringIO())
+    pd.read_csv(io.StringIO('a\n1'))
+    pd.to_datetime(['2024-01-01'])
+    yield
+
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Create a temporary directory with mock CSV data for testing."""
@@ -18,6 +18,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 from analysis.scoring_engine import (
     calculate_source_weight,
     calculate_impact_score,
+    calculate_source_weight_vec,
+    calculate_impact_score_vec,
     enrich_dataframe_with_scores
 )
 
@@ -502,6 +504,29 @@ class TestDataFrameEnrichment(unittest.TestCase):
         # Enriched DataFrame should have new columns
         self.assertIn('source_weight', enriched_df.columns)
         self.assertIn('impact_score', enriched_df.columns)
+    
+    def test_scoring_vectorized_matches_row(self):
+        """Test that the vectorized scorers match the row-wise functions"""
+        df = pd.DataFrame([
+            {'source': 'Internal Sales Notes', 'sentiment': 'negative', 'severity': 1.0,
+             'strategic_goal': 'Growth', 'ARR_impact_estimate_USD': 100000},
+            {'source': 'Internal Sales Notes', 'sentiment': 'neutral', 'severity': 0.4,
+             'strategic_goal': 'General', 'ARR_impact_estimate_USD': 'invalid'},
+            {'source': 'Twitter (X)', 'sentiment': 'POSITIVE', 'severity': 'invalid',
+             'strategic_goal': 'CX Efficiency', 'followers': 20000},
+            {'source': 'iOS App Store', 'sentiment': None, 'severity': None,
+             'strategic_goal': None, 'rating': 4.0, 'helpful_votes': np.nan},
+            {'source': 'Google Play Store', 'sentiment': 'negative', 'severity': 0.7,
+             'strategic_goal': 'Compliance', 'rating': 'invalid', 'helpful_votes': 3},
+            {'source': None, 'sentiment': 'unexpected', 'severity': 2.0,
+             'strategic_goal': 'Trust&Safety'}
+        ])
+        
+        expected_weights = df.apply(calculate_source_weight, axis=1).to_numpy()
+        expected_scores = df.apply(calculate_impact_score, axis=1).to_numpy()
+        
+        self.assertTrue(np.allclose(calculate_source_weight_vec(df), expected_weights))
+        self.assertTrue(np.allclose(calculate_impact_score_vec(df), expected_scores))
 
 
 if __name__ == '__main__':
@@ -5,29 +5,26 @@ Tests cover data normalization, column mapping, and DataFrame unification
 functionality with various edge cases and error conditions.
 """
 
+import functools
 import unittest
 import pandas as pd
 import numpy as np
-import sys
-import os
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
-from data_processing.data_normalizer import (
-    normalize_column_names,
-    map_feedback_text_column,
-    map_author_handle_column,
-    add_source_channel_column,
+from src.data_processing.data_normalizer import (
+    normalize_single_source,
+    normalize_feedback_text,
+    normalize_author_handle,
+    add_source_channel,
+    unify_dataframes,
     normalize_and_unify_data
 )
 
 
-class TestNormalizeColumnNames(unittest.TestCase):
-    """Test cases for normalize_column_names function."""
+class TestNormalizeSingleSource(unittest.TestCase):
+    """Test cases for normalize_single_source function."""
     
     def test_normalize_ios_columns(self):
-        """Test column normalization for iOS data."""
+        """Test normalization for iOS data keeps the source columns."""
         df = pd.DataFrame({
             'customer_id': ['IOS-001'],
             'source': ['iOS App Store'],
@@ -41,17 +38,20 @@ class TestNormalizeColumnNames(unittest.TestCase):
             'strategic_goal': ['Growth']
         })
         
-        result = normalize_column_names(df, 'ios_reviews')
+        result = normalize_single_source(df, 'ios_reviews')
         
-        # Check that all expected columns are present
+        # Check that all original columns are present alongside the normalized ones
         expected_columns = ['customer_id', 'source', 'username', 'timestamp', 
                           'rating', 'sentiment', 'review_text', 'theme', 
-                          'severity', 'strategic_goal']
-        for col in expected_columns:
-            self.assertIn(col, result.columns)
+                          'severity', 'strategic_goal',
+                          'feedback_text', 'author_handle', 'source_channel']
+        self.assertEqual(set(expected_columns) - set(result.columns), set())
+        self.assertEqual(result['feedback_text'].iat[0], 'Great app')
+        self.assertEqual(result['author_handle'].iat[0], 'user1')
+        self.assertEqual(result['source_channel'].iat[0], 'iOS App Store')
     
     def test_normalize_twitter_columns(self):
-        """Test column normalization for Twitter data."""
+        """Test normalization for Twitter data keeps the source columns."""
         df = pd.DataFrame({
             'customer_id': ['TW-001'],
             'source': ['Twitter'],
@@ -65,89 +65,90 @@ class TestNormalizeColumnNames(unittest.TestCase):
             'strategic_goal': ['Growth']
         })
         
-        result = normalize_column_names(df, 'twitter_mentions')
+        result = normalize_single_source(df, 'twitter_mentions')
         
-        # Check that all expected columns are present
+        # Check that all original columns are present alongside the normalized ones
         expected_columns = ['customer_id', 'source', 'handle', 'followers',
                           'timestamp', 'sentiment', 'tweet_text', 'theme',
-                          'severity', 'strategic_goal']
-        for col in expected_columns:
-            self.assertIn(col, result.columns)
+                          'severity', 'strategic_goal',
+                          'feedback_text', 'author_handle', 'source_channel']
+        self.assertEqual(set(expected_columns) - set(result.columns), set())
+        self.assertEqual(result['source_channel'].iat[0], 'Twitter (X)')
     
     def test_normalize_unknown_source(self):
-        """Test column normalization for unknown source type."""
+        """Test normalization for unknown source type."""
         df = pd.DataFrame({'test_col': ['value']})
         
-        result = normalize_column_names(df, 'unknown_source')
+        result = normalize_single_source(df, 'unknown_source')
         
-        # Should return original DataFrame unchanged
+        # Should return an unchanged copy of the original DataFrame
         self.assertTrue(result.equals(df))
+        self.assertIsNot(result, df)
 
 
-class TestMapFeedbackTextColumn(unittest.TestCase):
-    """Test cases for map_feedback_text_column function."""
+class TestNormalizeFeedbackText(unittest.TestCase):
+    """Test cases for normalize_feedback_text function."""
     
     def test_map_review_text(self):
         """Test mapping review_text to feedback_text."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'review_text': ['This is a review']
-        })
+        }, dtype='string')
         
-        result = map_feedback_text_column(df)
+        result = normalize_feedback_text(df, 'ios_reviews')
         
         self.assertIn('feedback_text', result.columns)
-        self.assertEqual(result.iloc[0]['feedback_text'], 'This is a review')
+        self.assertEqual(result['feedback_text'].iat[0], 'This is a review')
     
     def test_map_tweet_text(self):
         """Test mapping tweet_text to feedback_text."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'tweet_text': ['This is a tweet']
-        })
+        }, dtype='string')
         
-        result = map_feedback_text_column(df)
+        result = normalize_feedback_text(df, 'twitter_mentions')
         
         self.assertIn('feedback_text', result.columns)
-        self.assertEqual(result.iloc[0]['feedback_text'], 'This is a tweet')
+        self.assertEqual(result['feedback_text'].iat[0], 'This is a tweet')
     
     def test_map_note_text(self):
         """Test mapping note_text to feedback_text."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'note_text': ['This is a note']
-        })
+        }, dtype='string')
         
-        result = map_feedback_text_column(df)
+        result = normalize_feedback_text(df, 'sales_notes')
         
         self.assertIn('feedback_text', result.columns)
-        self.assertEqual(result.iloc[0]['feedback_text'], 'This is a note')
+        self.assertEqual(result['feedback_text'].iat[0], 'This is a note')
     
-    def test_map_no_text_columns(self):
-        """Test mapping when no text columns are present."""
+    def test_map_missing_text_column(self):
+        """Test mapping when the source's text column is absent."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'other_column': ['value']
-        })
+        }, dtype='string')
         
-        result = map_feedback_text_column(df)
+        result = normalize_feedback_text(df, 'ios_reviews')
         
-        self.assertIn('feedback_text', result.columns)
-        self.assertEqual(result.iloc[0]['feedback_text'], '')
+        # The DataFrame is returned without a feedback_text column
+        self.assertNotIn('feedback_text', result.columns)
     
-    def test_map_multiple_text_columns(self):
-        """Test mapping when multiple text columns are present."""
+    def test_map_uses_source_specific_column(self):
+        """Test that only the source type's own text column is mapped."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'review_text': ['Review text'],
             'tweet_text': ['Tweet text'],
             'note_text': ['Note text']
-        })
+        }, dtype='string')
         
-        result = map_feedback_text_column(df)
+        result = normalize_feedback_text(df, 'twitter_mentions')
         
-        # Should prioritize review_text first
-        self.assertEqual(result.iloc[0]['feedback_text'], 'Review text')
+        self.assertEqual(result['feedback_text'].iat[0], 'Tweet text')
     
     def test_map_null_text_values(self):
         """Test mapping with null text values."""
@@ -156,140 +157,163 @@ class TestMapFeedbackTextColumn(unittest.TestCase):
             'review_text': [None, np.nan]
         })
         
-        result = map_feedback_text_column(df)
+        result = normalize_feedback_text(df, 'ios_reviews')
         
-        # Should handle null values gracefully
-        self.assertTrue(all(result['feedback_text'] == ''))
+        # Null values are carried over unchanged
+        self.assertTrue(result['feedback_text'].isna().all())
 
 
-class TestMapAuthorHandleColumn(unittest.TestCase):
-    """Test cases for map_author_handle_column function."""
+class TestNormalizeAuthorHandle(unittest.TestCase):
+    """Test cases for normalize_author_handle function."""
     
     def test_map_username(self):
         """Test mapping username to author_handle."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'username': ['user123']
-        })
+        }, dtype='string')
         
-        result = map_author_handle_column(df)
+        result = normalize_author_handle(df, 'ios_reviews')
         
         self.assertIn('author_handle', result.columns)
-        self.assertEqual(result.iloc[0]['author_handle'], 'user123')
+        self.assertEqual(result['author_handle'].iat[0], 'user123')
     
     def test_map_handle(self):
         """Test mapping handle to author_handle."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'handle': ['@user123']
-        })
+        }, dtype='string')
         
-        result = map_author_handle_column(df)
+        result = normalize_author_handle(df, 'twitter_mentions')
         
         self.assertIn('author_handle', result.columns)
-        self.assertEqual(result.iloc[0]['author_handle'], '@user123')
+        self.assertEqual(result['author_handle'].iat[0], '@user123')
     
     def test_map_account_name(self):
         """Test mapping account_name to author_handle."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'account_name': ['Account Name']
-        })
+        }, dtype='string')
         
-        result = map_author_handle_column(df)
+        result = normalize_author_handle(df, 'sales_notes')
         
         self.assertIn('author_handle', result.columns)
-        self.assertEqual(result.iloc[0]['author_handle'], 'Account Name')
+        self.assertEqual(result['author_handle'].iat[0], 'Account Name')
     
-    def test_map_no_handle_columns(self):
-        """Test mapping when no handle columns are present."""
+    def test_map_missing_handle_column(self):
+        """Test mapping when the source's handle column is absent."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'other_column': ['value']
-        })
+        }, dtype='string')
         
-        result = map_author_handle_column(df)
+        result = normalize_author_handle(df, 'ios_reviews')
         
-        self.assertIn('author_handle', result.columns)
-        self.assertEqual(result.iloc[0]['author_handle'], 'Unknown')
+        # The DataFrame is returned without an author_handle column
+        self.assertNotIn('author_handle', result.columns)
 
 
-class TestAddSourceChannelColumn(unittest.TestCase):
-    """Test cases for add_source_channel_column function."""
+class TestAddSourceChannel(unittest.TestCase):
+    """Test cases for add_source_channel function."""
     
     def test_add_source_channel_ios(self):
         """Test adding source channel for iOS data."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'source': ['iOS App Store']
-        })
+        }, dtype='string')
         
-        result = add_source_channel_column(df, 'ios_reviews')
+        result = add_source_channel(df, 'ios_reviews')
         
         self.assertIn('source_channel', result.columns)
-        self.assertEqual(result.iloc[0]['source_channel'], 'iOS App Store')
+        self.assertEqual(result['source_channel'].iat[0], 'iOS App Store')
     
     def test_add_source_channel_twitter(self):
         """Test adding source channel for Twitter data."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'source': ['Twitter']
-        })
+        }, dtype='string')
         
-        result = add_source_channel_column(df, 'twitter_mentions')
+        result = add_source_channel(df, 'twitter_mentions')
         
         self.assertIn('source_channel', result.columns)
-        self.assertEqual(result.iloc[0]['source_channel'], 'Twitter (X)')
+        self.assertEqual(result['source_channel'].iat[0], 'Twitter (X)')
     
     def test_add_source_channel_unknown(self):
         """Test adding source channel for unknown source type."""
         df = pd.DataFrame({
             'customer_id': ['TEST-001'],
             'source': ['Unknown']
-        })
+        }, dtype='string')
         
-        result = add_source_channel_column(df, 'unknown_source')
+        result = add_source_channel(df, 'unknown_source')
         
-        self.assertIn('source_channel', result.columns)
-        self.assertEqual(result.iloc[0]['source_channel'], 'Unknown')
+        # Unknown source types are left without a source_channel column
+        self.assertNotIn('source_channel', result.columns)
+
+
+def _arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert a fixture to Arrow-backed dtypes when pandas/pyarrow support it."""
+    try:
+        return df.convert_dtypes(dtype_backend="pyarrow")
+    except (TypeError, ImportError):
+        # pandas < 2.0 or pyarrow not installed
+        return df
+
+
+# Shared read-only source frames for the unification tests, built once
+_SOURCE_DFS = {
+    'ios_reviews': _arrow_backed(pd.DataFrame({
+        'customer_id': ['IOS-001', 'IOS-002'],
+        'source': ['iOS App Store', 'iOS App Store'],
+        'username': ['user1', 'user2'],
+        'timestamp': ['2024-01-01', '2024-01-02'],
+        'rating': [4, 5],
+        'sentiment': ['positive', 'positive'],
+        'review_text': ['Great app', 'Love it'],
+        'theme': ['Performance', 'Features'],
+        'severity': [1.0, 0.5],
+        'strategic_goal': ['Growth', 'Growth']
+    })),
+    'twitter_mentions': _arrow_backed(pd.DataFrame({
+        'customer_id': ['TW-001', 'TW-002'],
+        'source': ['Twitter', 'Twitter'],
+        'handle': ['@user1', '@user2'],
+        'followers': [1000, 2000],
+        'timestamp': ['2024-01-03', '2024-01-04'],
+        'sentiment': ['positive', 'negative'],
+        'tweet_text': ['Great platform', 'Having issues'],
+        'theme': ['Features', 'Support'],
+        'severity': [1.0, 2.0],
+        'strategic_goal': ['Growth', 'CX Efficiency']
+    }))
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _unify_once(sources: frozenset) -> pd.DataFrame:
+    """Normalize and unify the given sample sources once per test module."""
+    # Shallow copies share the underlying Arrow buffers with the fixtures
+    return normalize_and_unify_data(
+        {k: df.copy(deep=False) for k, df in _SOURCE_DFS.items() if k in sources}
+    )
+
+
+def _cached_unify(sources: frozenset) -> pd.DataFrame:
+    """Return a private copy of the cached unified frame for the given sources."""
+    # The cached frame is shared across tests; in-place edits must not leak
+    return _unify_once(sources).copy()
 
 
 class TestNormalizeAndUnifyData(unittest.TestCase):
     """Test cases for normalize_and_unify_data function."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.ios_data = pd.DataFrame({
-            'customer_id': ['IOS-001', 'IOS-002'],
-            'source': ['iOS App Store', 'iOS App Store'],
-            'username': ['user1', 'user2'],
-            'timestamp': ['2024-01-01', '2024-01-02'],
-            'rating': [4, 5],
-            'sentiment': ['positive', 'positive'],
-            'review_text': ['Great app', 'Love it'],
-            'theme': ['Performance', 'Features'],
-            'severity': [1.0, 0.5],
-            'strategic_goal': ['Growth', 'Growth']
-        })
-        
-        self.twitter_data = pd.DataFrame({
-            'customer_id': ['TW-001', 'TW-002'],
-            'source': ['Twitter', 'Twitter'],
-            'handle': ['@user1', '@user2'],
-            'followers': [1000, 2000],
-            'timestamp': ['2024-01-03', '2024-01-04'],
-            'sentiment': ['positive', 'negative'],
-            'tweet_text': ['Great platform', 'Having issues'],
-            'theme': ['Features', 'Support'],
-            'severity': [1.0, 2.0],
-            'strategic_goal': ['Growth', 'CX Efficiency']
-        })
-    
     def test_normalize_single_source(self):
         """Test normalization with single data source."""
-        loaded_data = {'ios_reviews': self.ios_data}
-        
-        result = normalize_and_unify_data(loaded_data)
+        result = _cached_unify(frozenset({'ios_reviews'}))
         
         # Check unified structure
         self.assertEqual(len(result), 2)
@@ -298,18 +322,13 @@ class TestNormalizeAndUnifyData(unittest.TestCase):
         self.assertIn('source_channel', result.columns)
         
         # Check data integrity
-        self.assertEqual(result.iloc[0]['feedback_text'], 'Great app')
-        self.assertEqual(result.iloc[0]['author_handle'], 'user1')
-        self.assertEqual(result.iloc[0]['source_channel'], 'iOS App Store')
+        self.assertEqual(result['feedback_text'].iat[0], 'Great app')
+        self.assertEqual(result['author_handle'].iat[0], 'user1')
+        self.assertEqual(result['source_channel'].iat[0], 'iOS App Store')
     
     def test_normalize_multiple_sources(self):
         """Test normalization with multiple data sources."""
-        loaded_data = {
-            'ios_reviews': self.ios_data,
-            'twitter_mentions': self.twitter_data
-        }
-        
-        result = normalize_and_unify_data(loaded_data)
+        result = _cached_unify(frozenset({'ios_reviews', 'twitter_mentions'}))
         
         # Check unified structure
         self.assertEqual(len(result), 4)  # 2 iOS + 2 Twitter
@@ -330,12 +349,8 @@ class TestNormalizeAndUnifyData(unittest.TestCase):
         
         result = normalize_and_unify_data(loaded_data)
         
-        # Should return empty DataFrame with expected columns
+        # Should return an empty DataFrame
         self.assertTrue(result.empty)
-        expected_columns = ['customer_id', 'source_channel', 'feedback_text', 
-                          'author_handle', 'timestamp']
-        for col in expected_columns:
-            self.assertIn(col, result.columns)
     
     def test_normalize_with_missing_columns(self):
         """Test normalization with missing columns in source data."""
@@ -349,23 +364,35 @@ class TestNormalizeAndUnifyData(unittest.TestCase):
         
         result = normalize_and_unify_data(loaded_data)
         
-        # Should handle missing columns gracefully
-        self.assertEqual(len(result), 1)
-        self.assertIn('feedback_text', result.columns)
-        self.assertIn('author_handle', result.columns)
+        # The unified frame fails validation, so nothing is returned
+        self.assertTrue(result.empty)
+    
+    def test_unify_dtypes_independent_of_input_backend(self):
+        """Test that NumPy- and Arrow-backed inputs unify to the same dtypes."""
+        numpy_backed = {k: pd.DataFrame(df.to_dict('list')) for k, df in _SOURCE_DFS.items()}
+        
+        from_numpy = unify_dataframes(numpy_backed)
+        from_arrow = _cached_unify(frozenset(_SOURCE_DFS))
+        
+        pd.testing.assert_series_equal(from_numpy.dtypes, from_arrow.dtypes)
+    
+    def test_unify_keeps_source_channel_of_unknown_sources(self):
+        """Test that frames of unknown source types keep their own source_channel."""
+        custom = pd.DataFrame({
+            'customer_id': ['CUSTOM-001'],
+            'source_channel': ['Custom Channel']
+        })
+        
+        result = unify_dataframes({'ios_reviews': _SOURCE_DFS['ios_reviews'], 'custom_source': custom})
         
-        # Check default values
-        self.assertEqual(result.iloc[0]['feedback_text'], '')
-        self.assertEqual(result.iloc[0]['author_handle'], 'Unknown')
+        self.assertEqual(
+            result['source_channel'].tolist(),
+            ['iOS App Store', 'iOS App Store', 'Custom Channel']
+        )
     
     def test_normalize_preserves_source_specific_columns(self):
         """Test that source-specific columns are preserved."""
-        loaded_data = {
-            'ios_reviews': self.ios_data,
-            'twitter_mentions': self.twitter_data
-        }
-        
-        result = normalize_and_unify_data(loaded_data)
+        result = _cached_unify(frozenset({'ios_reviews', 'twitter_mentions'}))
         
         # Check that source-specific columns are preserved
         ios_rows = result[result['source_channel'] == 'iOS App Store']
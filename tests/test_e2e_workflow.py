@@ -8,9 +8,9 @@ Requirements: 8.2, 8.3, 8.4
 """
 
 import unittest
+import numpy as np
 import pandas as pd
 import tempfile
-import shutil
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -25,7 +25,10 @@ try:
     from data_processing.data_loader import load_all_csv_files
     from data_processing.data_normalizer import normalize_and_unify_data
     from analysis.nlp_models import get_sentiment, get_theme, get_strategic_goal
-    from analysis.scoring_engine import calculate_source_weight, calculate_impact_score
+    from analysis.scoring_engine import (
+        calculate_source_weight, calculate_impact_score,
+        calculate_source_weight_vec, calculate_impact_score_vec
+    )
     from reporting.content_builder import build_comprehensive_content
     from reporting.report_generator import generate_complete_report
 except ImportError as e:
@@ -33,6 +36,20 @@ except ImportError as e:
     print(f"Import warning: {e}")
     pass
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+
+def _write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write a fixture CSV with Arrow's C++ writer, falling back to pandas."""
+    if pa is not None:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+    else:
+        df.to_csv(path, index=False, lineterminator='\n')
+
 
 class TestEndToEndWorkflow(unittest.TestCase):
     """
@@ -41,25 +58,35 @@ class TestEndToEndWorkflow(unittest.TestCase):
     Requirements: 8.2, 8.3, 8.4
     """
     
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = os.path.join(self.temp_dir, 'csv_mock_data')
-        self.output_dir = os.path.join(self.temp_dir, 'output')
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared test environment once for all tests."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._tmp.name
+        cls.data_dir = os.path.join(cls.temp_dir, 'csv_mock_data')
+        cls.output_dir = os.path.join(cls.temp_dir, 'output')
         
         # Create directories
-        os.makedirs(self.data_dir, exist_ok=True)
-        os.makedirs(self.output_dir, exist_ok=True)
+        os.makedirs(cls.data_dir, exist_ok=True)
+        os.makedirs(cls.output_dir, exist_ok=True)
+        
+        # Create mock CSV files once; tests only read them
+        cls._create_mock_csv_files()
         
-        # Create mock CSV files for testing
-        self._create_mock_csv_files()
+        # Load and normalize once; tests share the results read-only
+        try:
+            cls._dataframes = load_all_csv_files(cls.data_dir)
+            cls._normalized_df = normalize_and_unify_data(cls._dataframes)
+        except (ImportError, NameError):
+            cls._dataframes = cls._normalized_df = None
     
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test environment."""
+        cls._tmp.cleanup()
     
-    def _create_mock_csv_files(self):
+    @classmethod
+    def _create_mock_csv_files(cls):
         """Create mock CSV files for testing."""
         # iOS App Store reviews
         ios_data = pd.DataFrame({
@@ -67,15 +94,15 @@ class TestEndToEndWorkflow(unittest.TestCase):
             'source': ['iOS App Store', 'iOS App Store'],
             'username': ['user1', 'user2'],
             'timestamp': ['2024-01-01 10:00:00', '2024-01-02 11:00:00'],
-            'rating': [4, 2],
+            'rating': np.array([4, 2], dtype=np.int8),
             'sentiment': ['positive', 'negative'],
             'review_text': ['Great app!', 'Needs improvement'],
             'theme': ['Performance', 'Trading/Execution & Fees'],
-            'severity': [1.0, 2.0],
+            'severity': np.array([1.0, 2.0], dtype=np.float32),
             'strategic_goal': ['Growth', 'CX Efficiency'],
-            'helpful_votes': [5, 10]
+            'helpful_votes': np.array([5, 10], dtype=np.int8)
         })
-        ios_data.to_csv(os.path.join(self.data_dir, 'coinbase_advance_apple_reviews.csv'), index=False)
+        _write_csv(ios_data, os.path.join(cls.data_dir, 'coinbase_advance_apple_reviews.csv'))
         
         # Google Play Store reviews
         android_data = pd.DataFrame({
@@ -83,30 +110,30 @@ class TestEndToEndWorkflow(unittest.TestCase):
             'source': ['Google Play Store', 'Google Play Store'],
             'username': ['android_user1', 'android_user2'],
             'timestamp': ['2024-01-03 12:00:00', '2024-01-04 13:00:00'],
-            'rating': [5, 3],
+            'rating': np.array([5, 3], dtype=np.int8),
             'sentiment': ['positive', 'neutral'],
             'review_text': ['Excellent app!', 'Decent app'],
             'theme': ['General Feedback', 'Support Experience'],
-            'severity': [0.5, 1.5],
+            'severity': np.array([0.5, 1.5], dtype=np.float32),
             'strategic_goal': ['Growth', 'Trust&Safety'],
-            'helpful_votes': [8, 4]
+            'helpful_votes': np.array([8, 4], dtype=np.int8)
         })
-        android_data.to_csv(os.path.join(self.data_dir, 'coinbase_advanceGoogle_Play.csv'), index=False)
+        _write_csv(android_data, os.path.join(cls.data_dir, 'coinbase_advanceGoogle_Play.csv'))
         
         # Twitter mentions
         twitter_data = pd.DataFrame({
             'customer_id': ['TW-001', 'TW-002'],
             'source': ['Twitter (X)', 'Twitter (X)'],
             'handle': ['@trader1', '@trader2'],
-            'followers': [148860, 106574],
+            'followers': np.array([148860, 106574], dtype=np.int32),
             'timestamp': ['2024-01-05 14:00:00', '2024-01-06 15:00:00'],
             'sentiment': ['positive', 'negative'],
             'tweet_text': ['Great trading experience!', 'Having issues'],
             'theme': ['Trading/Execution & Fees', 'Support Experience'],
-            'severity': [1.0, 2.0],
+            'severity': np.array([1.0, 2.0], dtype=np.float32),
             'strategic_goal': ['Growth', 'CX Efficiency']
         })
-        twitter_data.to_csv(os.path.join(self.data_dir, 'coinbase_advanced_twitter_mentions.csv'), index=False)
+        _write_csv(twitter_data, os.path.join(cls.data_dir, 'coinbase_advanced_twitter_mentions.csv'))
         
         # Internal sales notes
         sales_data = pd.DataFrame({
@@ -117,17 +144,23 @@ class TestEndToEndWorkflow(unittest.TestCase):
             'sentiment': ['positive', 'neutral'],
             'note_text': ['Customer very satisfied', 'Customer has concerns'],
             'theme': ['Performance', 'Trading/Execution & Fees'],
-            'severity': [1.0, 1.5],
+            'severity': np.array([1.0, 1.5], dtype=np.float32),
             'strategic_goal': ['Growth', 'CX Efficiency'],
-            'ARR_impact_estimate_USD': [75000, 25000]
+            'ARR_impact_estimate_USD': np.array([75000, 25000], dtype=np.int32)
         })
-        sales_data.to_csv(os.path.join(self.data_dir, 'coinbase_advance_internal_sales_notes.csv'), index=False)
+        _write_csv(sales_data, os.path.join(cls.data_dir, 'coinbase_advance_internal_sales_notes.csv'))
+    
+    def _shared_pipeline(self):
+        """Return the loaded and normalized data shared by the class."""
+        if self._normalized_df is None:
+            self.skipTest("Required modules not available for testing")
+        return self._dataframes, self._normalized_df
     
     def test_complete_data_pipeline_workflow(self):
         """Test the complete data pipeline from CSV loading to normalized output."""
         try:
             # 1. Load all CSV files
-            dataframes = load_all_csv_files(self.data_dir)
+            dataframes, normalized_df = self._shared_pipeline()
             
             # Verify all expected files were loaded
             expected_files = [
@@ -139,10 +172,7 @@ class TestEndToEndWorkflow(unittest.TestCase):
             
             self.assertEqual(len(dataframes), len(expected_files))
             
-            # 2. Normalize data
-            normalized_df = normalize_and_unify_data(dataframes)
-            
-            # Verify normalization results
+            # 2. Verify normalization results
             self.assertFalse(normalized_df.empty)
             self.assertIn('feedback_text', normalized_df.columns)
             self.assertIn('author_handle', normalized_df.columns)
@@ -159,24 +189,23 @@ class TestEndToEndWorkflow(unittest.TestCase):
         """Test NLP processing workflow with normalized data."""
         try:
             # Load and normalize data
-            dataframes = load_all_csv_files(self.data_dir)
-            normalized_df = normalize_and_unify_data(dataframes)
+            dataframes, normalized_df = self._shared_pipeline()
             
-            # Test NLP extraction functions on first row
+            # Test NLP extraction functions on first record
             if not normalized_df.empty:
-                row = normalized_df.iloc[0]
+                record = normalized_df.iloc[0].to_dict()
                 
                 # Test sentiment extraction
-                sentiment = get_sentiment(row)
+                sentiment = get_sentiment(record)
                 self.assertIn(sentiment, ['positive', 'neutral', 'negative'])
                 
                 # Test theme extraction
-                theme = get_theme(row)
+                theme = get_theme(record)
                 self.assertIsInstance(theme, str)
                 self.assertGreater(len(theme), 0)
                 
                 # Test strategic goal extraction
-                strategic_goal = get_strategic_goal(row)
+                strategic_goal = get_strategic_goal(record)
                 self.assertIsInstance(strategic_goal, str)
                 self.assertGreater(len(strategic_goal), 0)
                 
@@ -187,22 +216,28 @@ class TestEndToEndWorkflow(unittest.TestCase):
         """Test impact scoring workflow with processed data."""
         try:
             # Load and normalize data
-            dataframes = load_all_csv_files(self.data_dir)
-            normalized_df = normalize_and_unify_data(dataframes)
+            dataframes, normalized_df = self._shared_pipeline()
             
-            # Test source weight calculation on first row
+            # Test source weight calculation on first record
             if not normalized_df.empty:
-                row = normalized_df.iloc[0]
+                record = normalized_df.iloc[0].to_dict()
                 
-                source_weight = calculate_source_weight(row)
+                source_weight = calculate_source_weight(record)
                 self.assertIsInstance(source_weight, (int, float))
                 self.assertGreater(source_weight, 0)
                 
                 # Test impact score calculation
-                impact_score = calculate_impact_score(row)
+                impact_score = calculate_impact_score(record)
                 self.assertIsInstance(impact_score, (int, float))
                 self.assertGreaterEqual(impact_score, 0)
                 
+                # Score the whole frame column-wise and check it against the row-wise result
+                source_weights = calculate_source_weight_vec(normalized_df)
+                impact_scores = calculate_impact_score_vec(normalized_df, source_weights)
+                self.assertEqual(len(impact_scores), len(normalized_df))
+                self.assertAlmostEqual(source_weights[0], source_weight)
+                self.assertAlmostEqual(impact_scores[0], impact_score)
+                
         except ImportError:
             self.skipTest("Required modules not available for testing")
     
@@ -210,11 +245,10 @@ class TestEndToEndWorkflow(unittest.TestCase):
         """Test complete report generation workflow."""
         try:
             # Load and normalize data
-            dataframes = load_all_csv_files(self.data_dir)
-            normalized_df = normalize_and_unify_data(dataframes)
+            dataframes, normalized_df = self._shared_pipeline()
             
             # Test content building
-            report_content = build_comprehensive_content(normalized_df)
+            report_content = build_comprehensive_content(normalized_df.copy(deep=False))
             
             # Verify report content structure
             self.assertIn('executive_summary', report_content)
@@ -244,19 +278,17 @@ class TestEndToEndWorkflow(unittest.TestCase):
         """Test data consistency is maintained throughout the workflow."""
         try:
             # Load and normalize data
-            dataframes = load_all_csv_files(self.data_dir)
-            normalized_df = normalize_and_unify_data(dataframes)
+            dataframes, normalized_df = self._shared_pipeline()
             
             # Store original data for comparison
-            original_count = sum(len(df) for df in dataframes.values())
+            original_count = sum(map(len, dataframes.values()))
             
             # Verify no data was lost
             self.assertEqual(len(normalized_df), original_count)
             
             # Verify required columns are present
             required_columns = ['customer_id', 'feedback_text', 'author_handle', 'source_channel']
-            for col in required_columns:
-                self.assertIn(col, normalized_df.columns)
+            self.assertEqual(set(required_columns) - set(normalized_df.columns), set())
                 
         except ImportError:
             self.skipTest("Required modules not available for testing")
@@ -264,12 +296,9 @@ class TestEndToEndWorkflow(unittest.TestCase):
     def test_complete_end_to_end_execution(self):
         """Test complete end-to-end execution with all components."""
         try:
-            # Load data
-            dataframes = load_all_csv_files(self.data_dir)
+            # Load and normalize data
+            dataframes, normalized_df = self._shared_pipeline()
             self.assertGreater(len(dataframes), 0)
-            
-            # Normalize data
-            normalized_df = normalize_and_unify_data(dataframes)
             self.assertFalse(normalized_df.empty)
             
             # Verify final data quality
@@ -7,386 +7,312 @@ the system handles failures gracefully and provides meaningful error messages.
 Requirements: 8.2, 8.3, 8.4
 """
 
+import io
 import unittest
+import numpy as np
 import pandas as pd
+import pytest
 import tempfile
 import shutil
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# Import each area separately so a missing module only skips its own tests
 try:
-    from data_processing.data_loader import load_all_csv_files, validate_file_exists
+    from data_processing.data_loader import load_all_csv_files, load_csv_file, validate_file_exists
     from data_processing.data_normalizer import normalize_and_unify_data
     from analysis.nlp_models import get_sentiment, get_theme, get_strategic_goal
     from analysis.scoring_engine import calculate_source_weight, calculate_impact_score
+    IMPORTS_OK = True
+except ImportError as e:
+    print(f"Import warning: {e}")
+    IMPORTS_OK = False
+
+try:
     from reporting.content_builder import build_comprehensive_content
+    CONTENT_IMPORTS_OK = True
+except ImportError as e:
+    print(f"Import warning: {e}")
+    CONTENT_IMPORTS_OK = False
+
+try:
     from reporting.report_generator import generate_complete_report
+    REPORT_IMPORTS_OK = True
+except ImportError as e:
+    print(f"Import warning: {e}")
+    REPORT_IMPORTS_OK = False
+
+try:
     from dashboard.components import display_kpi_header
+    DASHBOARD_IMPORTS_OK = True
 except ImportError as e:
     print(f"Import warning: {e}")
-    pass
+    DASHBOARD_IMPORTS_OK = False
 
+SKIP_REASON = "Required modules not available for testing"
 
-class TestDataLoadingErrors(unittest.TestCase):
-    """Test error scenarios in data loading."""
+# Malformed iOS review payloads: (label, CSV text, whether the loader keeps it)
+MALFORMED_CSV_CASES = (
+    ('corrupted', 'invalid,csv,data\n"unclosed quote\nbroken,format', False),
+    ('missing_columns', 'customer_id,source\nTEST-001,iOS App Store\n', False),
+    ('invalid_types',
+     'customer_id,source,username,timestamp,rating,sentiment,review_text,theme,severity,strategic_goal\n'
+     'TEST-001,iOS App Store,user1,invalid_timestamp,not_a_number,positive,Test review,Performance,not_numeric,Growth\n',
+     True),
+)
+
+# Read-only NLP and scoring records; copy before mutating
+_NONE_RECORD = pd.Series({'sentiment': None, 'theme': None, 'strategic_goal': None}, dtype=object)
+_INCOMPLETE_RECORD = pd.Series({'source': 'Unknown Source', 'sentiment': 'positive'}, dtype=object)
+
+# Read-only report inputs; the report code does not modify its input frame
+SINGLE_ROW_DF = pd.DataFrame({
+    'theme': ['Performance'],
+    'sentiment': ['positive'],
+    'impact_score': [5.0]
+})
+PROBLEMATIC_DF = pd.DataFrame({
+    'theme': ['Theme with very long name that might cause issues' * 10],
+    'sentiment': ['invalid_sentiment'],
+    'impact_score': [float('inf')],
+    'feedback_text': ['Text with special characters: ñáéíóú@#$%^&*()']
+})
+
+# Corrupted KPI input: nullable text columns and a mixed-type score column
+CORRUPT_KPI_DF = pd.DataFrame({
+    'sentiment': pd.array([None, 'invalid', ''], dtype='string'),
+    'theme': pd.array(['', None, 'Valid Theme'], dtype='string'),
+    'impact_score': pd.array([None, 'not_numeric', -1], dtype=object)
+})
+
+
+class _TempDirMixin:
+    """Class-scoped temporary directory with a subdirectory per test."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory for the whole class."""
+        super().setUpClass()
+        cls.class_temp_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.class_temp_dir, ignore_errors=True)
     
     def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        """Give each test its own subdirectory of the class directory."""
+        super().setUp()
+        self.temp_dir = os.path.join(self.class_temp_dir, self._testMethodName)
+        os.makedirs(self.temp_dir, exist_ok=True)
+
+
+class TestDataLoadingErrors(_TempDirMixin, unittest.TestCase):
+    """Test error scenarios in data loading."""
     
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_missing_data_directory(self):
         """Test behavior when data directory doesn't exist."""
-        try:
-            nonexistent_dir = os.path.join(self.temp_dir, 'nonexistent')
-            
-            with self.assertRaises(Exception):
-                load_all_csv_files(nonexistent_dir)
-                
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        nonexistent_dir = os.path.join(self.temp_dir, 'nonexistent')
+        
+        with self.assertRaises(Exception):
+            load_all_csv_files(nonexistent_dir)
     
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_empty_data_directory(self):
         """Test behavior when data directory is empty."""
-        try:
-            empty_dir = os.path.join(self.temp_dir, 'empty')
-            os.makedirs(empty_dir)
-            
-            result = load_all_csv_files(empty_dir)
-            
-            # Should return empty dict or handle gracefully
-            self.assertIsInstance(result, dict)
-            self.assertEqual(len(result), 0)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
-    
-    def test_corrupted_csv_files(self):
-        """Test behavior with corrupted CSV files."""
-        try:
-            # Create corrupted CSV file
-            corrupted_file = os.path.join(self.temp_dir, 'coinbase_advance_apple_reviews.csv')
-            with open(corrupted_file, 'w') as f:
-                f.write('invalid,csv,data\n"unclosed quote\nbroken,format')
-            
-            result = load_all_csv_files(self.temp_dir)
-            
-            # Should handle corrupted files gracefully
-            self.assertIsInstance(result, dict)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
-    
-    def test_csv_with_missing_columns(self):
-        """Test behavior with CSV files missing required columns."""
-        try:
-            # Create CSV with missing columns
-            incomplete_file = os.path.join(self.temp_dir, 'coinbase_advance_apple_reviews.csv')
-            incomplete_data = pd.DataFrame({
-                'customer_id': ['TEST-001'],
-                'source': ['iOS App Store']
-                # Missing other required columns
-            })
-            incomplete_data.to_csv(incomplete_file, index=False)
-            
-            result = load_all_csv_files(self.temp_dir)
-            
-            # Should handle missing columns gracefully
-            self.assertIsInstance(result, dict)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        empty_dir = os.path.join(self.temp_dir, 'empty')
+        os.makedirs(empty_dir)
+        
+        result = load_all_csv_files(empty_dir)
+        
+        # Should return empty dict or handle gracefully
+        self.assertIsInstance(result, dict)
+        self.assertEqual(len(result), 0)
     
-    def test_csv_with_invalid_data_types(self):
-        """Test behavior with invalid data types in CSV files."""
-        try:
-            # Create CSV with invalid data types
-            invalid_file = os.path.join(self.temp_dir, 'coinbase_advance_apple_reviews.csv')
-            invalid_data = pd.DataFrame({
-                'customer_id': ['TEST-001'],
-                'source': ['iOS App Store'],
-                'username': ['user1'],
-                'timestamp': ['invalid_timestamp'],
-                'rating': ['not_a_number'],
-                'sentiment': ['positive'],
-                'review_text': ['Test review'],
-                'theme': ['Performance'],
-                'severity': ['not_numeric'],
-                'strategic_goal': ['Growth']
-            })
-            invalid_data.to_csv(invalid_file, index=False)
-            
-            result = load_all_csv_files(self.temp_dir)
-            
-            # Should handle invalid data types gracefully
-            self.assertIsInstance(result, dict)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
+    def test_malformed_csv_variants(self):
+        """Test behavior with corrupted, incomplete and mistyped CSV payloads."""
+        for label, csv_text, loads in MALFORMED_CSV_CASES:
+            with self.subTest(label):
+                # Parse each payload from memory; no file is needed
+                result = load_csv_file(io.StringIO(csv_text), 'ios_reviews')
+                
+                if loads:
+                    # Should load the row and coerce the unparseable timestamp
+                    self.assertIsInstance(result, pd.DataFrame)
+                    self.assertTrue(result['timestamp'].isna().all())
+                else:
+                    # Should reject the payload gracefully
+                    self.assertIsNone(result)
 
 
-class TestDataProcessingErrors(unittest.TestCase):
+class TestDataProcessingErrors(_TempDirMixin, unittest.TestCase):
     """Test error scenarios in data processing."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-    
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_normalization_with_empty_data(self):
         """Test data normalization with empty datasets."""
-        try:
-            empty_data = {}
-            result = normalize_and_unify_data(empty_data)
-            
-            # Should return empty DataFrame with expected columns
-            self.assertIsInstance(result, pd.DataFrame)
-            self.assertTrue(result.empty)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        empty_data = {}
+        result = normalize_and_unify_data(empty_data)
+        
+        # Should return empty DataFrame with expected columns
+        self.assertIsInstance(result, pd.DataFrame)
+        self.assertTrue(result.empty)
     
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_normalization_with_null_values(self):
         """Test data normalization with null values."""
-        try:
-            null_data = {
-                'test.csv': pd.DataFrame({
-                    'customer_id': [None, 'TEST-002'],
-                    'source': ['iOS App Store', None],
-                    'username': [None, 'user2'],
-                    'timestamp': ['2024-01-01', None],
-                    'sentiment': [None, 'positive'],
-                    'review_text': ['', None],
-                    'theme': [None, ''],
-                    'severity': [None, 1.0],
-                    'strategic_goal': ['', None]
-                })
-            }
-            
-            result = normalize_and_unify_data(null_data)
-            
-            # Should handle null values gracefully
-            self.assertIsInstance(result, pd.DataFrame)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        null_data = {
+            'test.csv': pd.DataFrame({
+                'customer_id': [None, 'TEST-002'],
+                'source': ['iOS App Store', None],
+                'username': [None, 'user2'],
+                'timestamp': ['2024-01-01', None],
+                'sentiment': [None, 'positive'],
+                'review_text': ['', None],
+                'theme': [None, ''],
+                'severity': [None, 1.0],
+                'strategic_goal': ['', None]
+            })
+        }
+        
+        result = normalize_and_unify_data(null_data)
+        
+        # Should handle null values gracefully
+        self.assertIsInstance(result, pd.DataFrame)
     
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_nlp_processing_with_invalid_data(self):
         """Test NLP processing with invalid data."""
-        try:
-            # Test with None values
-            none_record = pd.Series({'sentiment': None, 'theme': None, 'strategic_goal': None})
-            
-            sentiment = get_sentiment(none_record)
-            theme = get_theme(none_record)
-            strategic_goal = get_strategic_goal(none_record)
-            
-            # Should return default values
-            self.assertIn(sentiment, ['positive', 'neutral', 'negative'])
-            self.assertIsInstance(theme, str)
-            self.assertIsInstance(strategic_goal, str)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        # Test with None values
+        sentiment = get_sentiment(_NONE_RECORD)
+        theme = get_theme(_NONE_RECORD)
+        strategic_goal = get_strategic_goal(_NONE_RECORD)
+        
+        # Should return default values
+        self.assertIn(sentiment, ['positive', 'neutral', 'negative'])
+        self.assertIsInstance(theme, str)
+        self.assertIsInstance(strategic_goal, str)
     
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_scoring_with_missing_data(self):
         """Test impact scoring with missing data."""
-        try:
-            # Test with missing required fields
-            incomplete_record = pd.Series({
-                'source': 'Unknown Source',
-                'sentiment': 'positive'
-                # Missing other fields needed for scoring
-            })
-            
-            source_weight = calculate_source_weight(incomplete_record)
-            impact_score = calculate_impact_score(incomplete_record)
-            
-            # Should return default values
-            self.assertIsInstance(source_weight, (int, float))
-            self.assertGreater(source_weight, 0)
-            self.assertIsInstance(impact_score, (int, float))
-            self.assertGreaterEqual(impact_score, 0)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        # Test with missing required fields (only source and sentiment are set)
+        source_weight = calculate_source_weight(_INCOMPLETE_RECORD)
+        impact_score = calculate_impact_score(_INCOMPLETE_RECORD)
+        
+        # Should return default values
+        self.assertIsInstance(source_weight, (int, float))
+        self.assertGreater(source_weight, 0)
+        self.assertIsInstance(impact_score, (int, float))
+        self.assertGreaterEqual(impact_score, 0)
 
 
-class TestReportGenerationErrors(unittest.TestCase):
-    """Test error scenarios in report generation."""
+@pytest.mark.slow
+class TestReportGenerationErrors(_TempDirMixin, unittest.TestCase):
+    """Test error scenarios in report generation (renders PDFs, marked slow)."""
     
     def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        """Point each test at its own output file."""
+        super().setUp()
         self.output_file = os.path.join(self.temp_dir, 'test_report.pdf')
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
     
+    @unittest.skipUnless(CONTENT_IMPORTS_OK, SKIP_REASON)
     def test_report_generation_with_empty_data(self):
         """Test report generation with empty data."""
-        try:
-            empty_df = pd.DataFrame()
-            
-            content = build_comprehensive_content(empty_df)
-            
-            # Should handle empty data gracefully
-            self.assertIsInstance(content, dict)
-            self.assertIn('executive_summary', content)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        empty_df = pd.DataFrame()
+        
+        content = build_comprehensive_content(empty_df)
+        
+        # Should handle empty data gracefully
+        self.assertIsInstance(content, dict)
+        self.assertIn('executive_summary', content)
     
+    @unittest.skipUnless(REPORT_IMPORTS_OK, SKIP_REASON)
     def test_report_generation_with_invalid_output_path(self):
         """Test report generation with invalid output path."""
-        try:
-            # Create minimal valid data
-            test_data = pd.DataFrame({
-                'theme': ['Performance'],
-                'sentiment': ['positive'],
-                'impact_score': [5.0]
-            })
-            
-            # Try to write to invalid path
-            invalid_path = '/invalid/path/that/cannot/be/created/report.pdf'
-            
-            result = generate_complete_report(test_data, invalid_path)
-            
-            # Should handle invalid path gracefully
-            self.assertIsInstance(result, dict)
-            self.assertFalse(result.get('success', True))
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        # Try to write minimal valid data to an invalid path
+        invalid_path = '/invalid/path/that/cannot/be/created/report.pdf'
+        
+        result = generate_complete_report(SINGLE_ROW_DF, invalid_path)
+        
+        # Should handle invalid path gracefully
+        self.assertIsInstance(result, dict)
+        self.assertFalse(result.get('success', True))
     
+    @unittest.skipUnless(CONTENT_IMPORTS_OK, SKIP_REASON)
     def test_pdf_creation_with_corrupted_content(self):
         """Test PDF creation with corrupted content."""
-        try:
-            # Create data with problematic values
-            problematic_data = pd.DataFrame({
-                'theme': ['Theme with very long name that might cause issues' * 10],
-                'sentiment': ['invalid_sentiment'],
-                'impact_score': [float('inf')],
-                'feedback_text': ['Text with special characters: ñáéíóú@#$%^&*()']
-            })
-            
-            content = build_comprehensive_content(problematic_data)
-            
-            # Should handle problematic data gracefully
-            self.assertIsInstance(content, dict)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        # Build content from data with problematic values
+        content = build_comprehensive_content(PROBLEMATIC_DF)
+        
+        # Should handle problematic data gracefully
+        self.assertIsInstance(content, dict)
 
 
-class TestDashboardErrors(unittest.TestCase):
+@unittest.skipUnless(DASHBOARD_IMPORTS_OK, SKIP_REASON)
+class TestDashboardErrors(_TempDirMixin, unittest.TestCase):
     """Test error scenarios in dashboard components."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create the Streamlit mocks for the whole class."""
+        super().setUpClass()
         
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-    
-    @patch('dashboard.components.st.columns')
-    @patch('dashboard.components.st.metric')
-    def test_kpi_display_with_empty_data(self, mock_metric, mock_columns):
+        # Mock Streamlit components once; the tests only read from them
+        columns_patcher = patch('dashboard.components.st.columns')
+        metric_patcher = patch('dashboard.components.st.metric')
+        cls.mock_columns = columns_patcher.start()
+        cls.mock_metric = metric_patcher.start()
+        cls.addClassCleanup(columns_patcher.stop)
+        cls.addClassCleanup(metric_patcher.stop)
+        cls.mock_columns.return_value = [MagicMock(), MagicMock(), MagicMock()]
+        
+    def test_kpi_display_with_empty_data(self):
         """Test KPI display with empty data."""
-        try:
-            # Mock Streamlit components
-            mock_col1, mock_col2, mock_col3 = MagicMock(), MagicMock(), MagicMock()
-            mock_columns.return_value = [mock_col1, mock_col2, mock_col3]
-            
-            mock_col1.metric = MagicMock()
-            mock_col2.metric = MagicMock()
-            mock_col3.metric = MagicMock()
-            
-            empty_df = pd.DataFrame()
-            
-            result = display_kpi_header(empty_df)
-            
-            # Should handle empty data gracefully
-            self.assertIsInstance(result, dict)
-            self.assertEqual(result['total_items'], 0)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        empty_df = pd.DataFrame()
+        
+        result = display_kpi_header(empty_df)
+        
+        # Should handle empty data gracefully
+        self.assertIsInstance(result, dict)
+        self.assertEqual(result['total_items'], 0)
     
-    @patch('dashboard.components.st.columns')
-    @patch('dashboard.components.st.metric')
-    def test_kpi_display_with_corrupted_data(self, mock_metric, mock_columns):
+    def test_kpi_display_with_corrupted_data(self):
         """Test KPI display with corrupted data."""
-        try:
-            # Mock Streamlit components
-            mock_col1, mock_col2, mock_col3 = MagicMock(), MagicMock(), MagicMock()
-            mock_columns.return_value = [mock_col1, mock_col2, mock_col3]
-            
-            mock_col1.metric = MagicMock()
-            mock_col2.metric = MagicMock()
-            mock_col3.metric = MagicMock()
-            
-            # Create corrupted data
-            corrupted_df = pd.DataFrame({
-                'sentiment': [None, 'invalid', ''],
-                'theme': ['', None, 'Valid Theme'],
-                'impact_score': [None, 'not_numeric', -1]
-            })
-            
-            result = display_kpi_header(corrupted_df)
-            
-            # Should handle corrupted data gracefully
-            self.assertIsInstance(result, dict)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        start_time = time.perf_counter()
+        result = display_kpi_header(CORRUPT_KPI_DF)
+        elapsed = time.perf_counter() - start_time
+        
+        # Should handle corrupted data gracefully and quickly
+        self.assertIsInstance(result, dict)
+        self.assertLess(elapsed, 1.0)
 
 
-class TestMemoryAndPerformanceErrors(unittest.TestCase):
+class TestMemoryAndPerformanceErrors(_TempDirMixin, unittest.TestCase):
     """Test memory and performance related error scenarios."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-    
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_large_dataset_memory_handling(self):
         """Test memory handling with large datasets."""
         try:
-            # Create a moderately large dataset
-            large_data = []
-            for i in range(5000):  # 5000 rows should be manageable
-                large_data.append({
-                    'customer_id': f'LARGE-{i:05d}',
-                    'source': 'Test Source',
-                    'sentiment': ['positive', 'neutral', 'negative'][i % 3],
-                    'theme': ['Performance', 'Support', 'Features'][i % 3],
-                    'impact_score': (i % 100) / 10.0,
-                    'feedback_text': f'Test feedback {i}'
-                })
-            
-            large_df = pd.DataFrame(large_data)
+            # Create a moderately large dataset column by column
+            n = 5000  # 5000 rows should be manageable
+            idx = np.arange(n)
+            row_labels = idx.astype(str)
+            # Explicit dtypes: strings, 3-value labels as categoricals, float32 scores
+            large_df = pd.DataFrame({
+                'customer_id': pd.array(np.char.add('LARGE-', np.char.zfill(row_labels, 5)), dtype='string'),
+                'source': pd.array(np.full(n, 'Test Source'), dtype='string'),
+                'sentiment': pd.Categorical.from_codes(idx % 3, categories=['positive', 'neutral', 'negative']),
+                'theme': pd.Categorical.from_codes(idx % 3, categories=['Performance', 'Support', 'Features']),
+                'impact_score': ((idx % 100) / 10.0).astype(np.float32),
+                'feedback_text': pd.array(np.char.add('Test feedback ', row_labels), dtype='string')
+            })
             
             # Test processing
             loaded_data = {'large_test.csv': large_df}
@@ -396,126 +322,106 @@ class TestMemoryAndPerformanceErrors(unittest.TestCase):
             self.assertIsInstance(result, pd.DataFrame)
             self.assertEqual(len(result), len(large_df))
             
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
         except MemoryError:
             self.skipTest("Insufficient memory for large dataset test")
     
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_infinite_loop_protection(self):
         """Test protection against infinite loops in processing."""
-        try:
-            # Create data that might cause processing issues
-            problematic_data = pd.DataFrame({
-                'customer_id': ['LOOP-001'] * 100,  # Duplicate IDs
-                'source': ['Test Source'] * 100,
-                'sentiment': ['positive'] * 100,
-                'theme': ['Performance'] * 100,
-                'impact_score': [float('inf')] * 100,  # Infinite values
-                'feedback_text': [''] * 100  # Empty text
-            })
-            
-            # Processing should complete in reasonable time
-            import time
-            start_time = time.time()
-            
-            loaded_data = {'problematic.csv': problematic_data}
-            result = normalize_and_unify_data(loaded_data)
-            
-            end_time = time.time()
-            processing_time = end_time - start_time
-            
-            # Should complete within reasonable time (5 seconds)
-            self.assertLess(processing_time, 5.0)
-            self.assertIsInstance(result, pd.DataFrame)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        # Create data that might cause processing issues
+        n = 100
+        problematic_data = pd.DataFrame({
+            'customer_id': np.full(n, 'LOOP-001', dtype=object),  # Duplicate IDs
+            'source': np.full(n, 'Test Source', dtype=object),
+            'sentiment': np.full(n, 'positive', dtype=object),
+            'theme': np.full(n, 'Performance', dtype=object),
+            'impact_score': np.full(n, np.inf),  # Infinite values
+            'feedback_text': np.full(n, '', dtype=object)  # Empty text
+        })
+        
+        # Processing should complete in reasonable time
+        start_time = time.perf_counter()
+        
+        loaded_data = {'problematic.csv': problematic_data}
+        result = normalize_and_unify_data(loaded_data)
+        
+        processing_time = time.perf_counter() - start_time
+        
+        # Should complete within reasonable time (5 seconds)
+        self.assertLess(processing_time, 5.0)
+        self.assertIsInstance(result, pd.DataFrame)
 
 
-class TestSystemIntegrationErrors(unittest.TestCase):
+class TestSystemIntegrationErrors(_TempDirMixin, unittest.TestCase):
     """Test system-level integration error scenarios."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-    
+    @pytest.mark.slow
+    @unittest.skipUnless(REPORT_IMPORTS_OK, SKIP_REASON)
     def test_disk_space_exhaustion_simulation(self):
         """Test behavior when disk space is exhausted."""
-        try:
-            # Create a very small temporary partition (simulation)
-            small_output_dir = os.path.join(self.temp_dir, 'small_output')
-            os.makedirs(small_output_dir)
-            
-            # Create minimal test data
-            test_data = pd.DataFrame({
-                'theme': ['Performance'],
-                'sentiment': ['positive'],
-                'impact_score': [5.0]
-            })
-            
-            # Try to generate report
-            output_path = os.path.join(small_output_dir, 'test_report.pdf')
-            result = generate_complete_report(test_data, output_path)
-            
-            # Should handle gracefully (either succeed or fail gracefully)
-            self.assertIsInstance(result, dict)
-            
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        # Create a very small temporary partition (simulation)
+        small_output_dir = os.path.join(self.temp_dir, 'small_output')
+        os.makedirs(small_output_dir)
+        
+        # Try to generate a report from minimal test data
+        output_path = os.path.join(small_output_dir, 'test_report.pdf')
+        result = generate_complete_report(SINGLE_ROW_DF, output_path)
+        
+        # Should handle gracefully (either succeed or fail gracefully)
+        self.assertIsInstance(result, dict)
     
+    @unittest.skipUnless(IMPORTS_OK, SKIP_REASON)
     def test_concurrent_access_simulation(self):
         """Test behavior with simulated concurrent access."""
-        try:
-            # Create test data
-            test_data = pd.DataFrame({
-                'customer_id': ['CONCURRENT-001', 'CONCURRENT-002'],
-                'source': ['Test Source', 'Test Source'],
-                'sentiment': ['positive', 'negative'],
-                'theme': ['Performance', 'Support'],
-                'impact_score': [5.0, 3.0],
-                'feedback_text': ['Good', 'Bad']
-            })
-            
-            # Simulate multiple processing attempts
-            results = []
-            for i in range(3):
-                loaded_data = {f'concurrent_{i}.csv': test_data}
-                result = normalize_and_unify_data(loaded_data)
-                results.append(result)
-            
-            # All should succeed
-            for result in results:
-                self.assertIsInstance(result, pd.DataFrame)
-                self.assertEqual(len(result), 2)
-                
-        except ImportError:
-            self.skipTest("Required modules not available for testing")
+        # Create test data
+        test_data = pd.DataFrame({
+            'customer_id': ['CONCURRENT-001', 'CONCURRENT-002'],
+            'source': ['Test Source', 'Test Source'],
+            'sentiment': ['positive', 'negative'],
+            'theme': ['Performance', 'Support'],
+            'impact_score': [5.0, 3.0],
+            'feedback_text': ['Good', 'Bad']
+        })
+        
+        # Run several processing attempts at the same time
+        loaded_batches = [{f'concurrent_{i}.csv': test_data} for i in range(3)]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(normalize_and_unify_data, loaded_batches))
+        
+        # All should succeed
+        for result in results:
+            self.assertIsInstance(result, pd.DataFrame)
+            self.assertEqual(len(result), 2)
+
+
+def _iter_tests(suite):
+    """Yield the individual test cases of a (possibly nested) unittest suite."""
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from _iter_tests(item)
+        else:
+            yield item
+
+
+def _is_slow(test):
+    """Whether a unittest case carries pytest's slow mark on its class or method."""
+    marks = list(getattr(type(test), 'pytestmark', []))
+    marks += getattr(getattr(test, test._testMethodName, None), 'pytestmark', [])
+    return any(mark.name == 'slow' for mark in marks)
 
 
 if __name__ == '__main__':
-    # Create comprehensive test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add all error scenario test classes
-    test_classes = [
-        TestDataLoadingErrors,
-        TestDataProcessingErrors,
-        TestReportGenerationErrors,
-        TestDashboardErrors,
-        TestMemoryAndPerformanceErrors,
-        TestSystemIntegrationErrors
-    ]
+    # Collect every error scenario test class in this module in one pass
+    test_suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
     
-    for test_class in test_classes:
-        test_suite.addTest(unittest.makeSuite(test_class))
+    # PDF-rendering tests are marked slow and skipped here unless RUN_SLOW=1
+    if os.environ.get('RUN_SLOW') != '1':
+        test_suite = unittest.TestSuite(
+            test for test in _iter_tests(test_suite) if not _is_slow(test)
+        )
     
-    # Run tests with detailed output
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Run tests quietly; output of passing tests is buffered and dropped
+    runner = unittest.TextTestRunner(verbosity=1, buffer=True)
     result = runner.run(test_suite)
     
     # Print summary
@@ -4,18 +4,26 @@ Integration tests for the main execution pipeline.
 This module tests the complete end-to-end workflow of the Advanced Trade Insight Engine,
 including data loading, processing, report generation, and dashboard preparation.
 
+Shared fixtures (the mock CSV corpus and the processed frames) are built once
+per class and are read-only; each test writes only to its own output
+directory, so the module can run under pytest-xdist. Use
+``--dist loadscope`` so each class, and its fixtures, stays on one worker.
+
 Requirements: 7.4, 7.5, 7.6
 """
 
 import unittest
+import argparse
 import os
 import sys
 import tempfile
 import shutil
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
@@ -27,6 +35,64 @@ from main import (
     process_nlp_and_scoring, generate_reports, prepare_dashboard_data,
     ProgressTracker, handle_graceful_failure
 )
+from data_processing import data_loader
+
+# Columns every source shares: two rows per source, in MOCK_SOURCE_COLUMNS order
+MOCK_COMMON_ROWS = pd.DataFrame({
+    'customer_id': ['ios_001', 'ios_002', 'android_001', 'android_002',
+                    'sales_001', 'sales_002', 'twitter_001', 'twitter_002'],
+    'source': np.repeat(['iOS App Store', 'Google Play Store', 'Internal Sales Notes', 'Twitter'], 2),
+    'timestamp': [f'2024-01-0{day} {day + 9}:00:00' for day in range(1, 9)],
+    'sentiment': ['positive', 'negative', 'positive', 'neutral',
+                  'negative', 'positive', 'neutral', 'negative'],
+    'theme': ['Performance', 'Trading/Execution & Fees', 'General Feedback', 'Support Experience',
+              'Trading/Execution & Fees', 'General Feedback', 'General Feedback', 'Performance/Outages'],
+    'severity': np.array([1.0, 2.0, 1.0, 1.5, 3.0, 1.0, 1.0, 2.5], dtype=np.float32),
+    'strategic_goal': ['Growth', 'CX Efficiency', 'Growth', 'Trust&Safety',
+                       'Growth', 'CX Efficiency', 'Growth', 'Trust&Safety']
+})
+
+# Source-specific columns keyed by the file name the pipeline expects
+MOCK_SOURCE_COLUMNS = {
+    'coinbase_advance_apple_reviews.csv': {
+        'username': ['user1', 'user2'],
+        'rating': np.array([4, 2], dtype=np.int8),
+        'review_text': ['Great app!', 'Needs improvement'],
+        'helpful_votes': np.array([5, 10], dtype=np.int8)
+    },
+    'coinbase_advanceGoogle_Play.csv': {
+        'username': ['user3', 'user4'],
+        'rating': np.array([5, 3], dtype=np.int8),
+        'review_text': ['Love it!', 'It\'s okay'],
+        'helpful_votes': np.array([3, 7], dtype=np.int8)
+    },
+    'coinbase_advance_internal_sales_notes.csv': {
+        'account_name': ['Enterprise Corp', 'Startup Inc'],
+        'note_text': ['Client wants better fees', 'Happy with service'],
+        'ARR_impact_estimate_USD': np.array([100000, 50000], dtype=np.int32)
+    },
+    'coinbase_advanced_twitter_mentions.csv': {
+        'handle': ['@trader1', '@crypto_fan'],
+        'followers': np.array([1000, 5000], dtype=np.int32),
+        'tweet_text': ['Using Coinbase Advanced', 'Issues with the platform']
+    }
+}
+
+
+def setUpModule():
+    """Silence the pipeline's INFO and WARNING logging while this module runs."""
+    logging.disable(logging.WARNING)
+
+
+def tearDownModule():
+    """Restore logging for the rest of the test run."""
+    logging.disable(logging.NOTSET)
+
+
+def _write_stub_report(df, output_path, top_n=3):
+    """Stand-in for generate_complete_report that skips PDF rendering."""
+    Path(output_path).write_bytes(b'%PDF-stub')
+    return {'success': True, 'output_path': output_path}
 
 
 class TestMainPipelineIntegration(unittest.TestCase):
@@ -36,92 +102,77 @@ class TestMainPipelineIntegration(unittest.TestCase):
     Requirements: 7.4, 7.5, 7.6
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Write the mock CSV corpus and run the pipeline steps on it once."""
+        # Registered as a class cleanup so the directory goes even if setup fails
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._tmp.cleanup)
+        cls.test_dir = cls._tmp.name
+        cls.template_dir = os.path.join(cls.test_dir, 'csv_mock_data')
+        os.makedirs(cls.template_dir)
+        cls._write_mock_csvs(cls.template_dir)
+        
+        # Load and score the template corpus once; tests treat the results as read-only
+        logger = logging.getLogger(__name__)
+        cls._normalized = load_and_normalize_data(cls.template_dir, logger)
+        cls._processed = None
+        if cls._normalized is not None:
+            cls._processed = process_nlp_and_scoring(cls._normalized, logger)
+        
+        # Snapshots to check that no test modified the shared frames
+        cls._snapshots = [
+            (df, df.copy()) for df in (cls._normalized, cls._processed) if df is not None
+        ]
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Check that no test modified the shared frames."""
+        for df, snapshot in cls._snapshots:
+            pd.testing.assert_frame_equal(df, snapshot)
+    
     def setUp(self):
-        """Set up test environment with temporary directories and mock data."""
-        # Create temporary directories
-        self.test_dir = tempfile.mkdtemp()
-        self.data_dir = os.path.join(self.test_dir, 'csv_mock_data')
-        self.output_dir = os.path.join(self.test_dir, 'output')
-        
-        os.makedirs(self.data_dir)
+        """Set up a per-test output directory next to the shared mock data."""
+        # The template corpus is shared and read-only
+        self.data_dir = self.template_dir
+        self.work_dir = os.path.join(self.test_dir, self._testMethodName)
+        self.output_dir = os.path.join(self.work_dir, 'output')
         os.makedirs(self.output_dir)
         
-        # Create mock CSV files with minimal valid data
-        self.create_mock_csv_files()
-        
-        # Setup logging for tests
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
     def tearDown(self):
-        """Clean up temporary test directories."""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        """Remove this test's output; the class directory is removed once."""
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def _make_tracker(self, *steps):
+        """Create a ProgressTracker on the test logger with the given (name, description) steps."""
+        progress_tracker = ProgressTracker(self.logger)
+        for name, description in steps:
+            progress_tracker.add_step(name, description)
+        return progress_tracker
     
-    def create_mock_csv_files(self):
-        """Create mock CSV files with valid test data."""
-        
-        # iOS App Store reviews
-        ios_data = pd.DataFrame({
-            'customer_id': ['ios_001', 'ios_002'],
-            'source': ['iOS App Store', 'iOS App Store'],
-            'username': ['user1', 'user2'],
-            'timestamp': ['2024-01-01 10:00:00', '2024-01-02 11:00:00'],
-            'rating': [4, 2],
-            'sentiment': ['positive', 'negative'],
-            'review_text': ['Great app!', 'Needs improvement'],
-            'theme': ['Performance', 'Trading/Execution & Fees'],
-            'severity': [1.0, 2.0],
-            'strategic_goal': ['Growth', 'CX Efficiency'],
-            'helpful_votes': [5, 10]
-        })
-        ios_data.to_csv(os.path.join(self.data_dir, 'coinbase_advance_apple_reviews.csv'), index=False)
-        
-        # Google Play Store reviews
-        android_data = pd.DataFrame({
-            'customer_id': ['android_001', 'android_002'],
-            'source': ['Google Play Store', 'Google Play Store'],
-            'username': ['user3', 'user4'],
-            'timestamp': ['2024-01-03 12:00:00', '2024-01-04 13:00:00'],
-            'rating': [5, 3],
-            'sentiment': ['positive', 'neutral'],
-            'review_text': ['Love it!', 'It\'s okay'],
-            'theme': ['General Feedback', 'Support Experience'],
-            'severity': [1.0, 1.5],
-            'strategic_goal': ['Growth', 'Trust&Safety'],
-            'helpful_votes': [3, 7]
-        })
-        android_data.to_csv(os.path.join(self.data_dir, 'coinbase_advanceGoogle_Play.csv'), index=False)
-        
-        # Internal sales notes
-        sales_data = pd.DataFrame({
-            'customer_id': ['sales_001', 'sales_002'],
-            'source': ['Internal Sales Notes', 'Internal Sales Notes'],
-            'account_name': ['Enterprise Corp', 'Startup Inc'],
-            'timestamp': ['2024-01-05 14:00:00', '2024-01-06 15:00:00'],
-            'sentiment': ['negative', 'positive'],
-            'note_text': ['Client wants better fees', 'Happy with service'],
-            'theme': ['Trading/Execution & Fees', 'General Feedback'],
-            'severity': [3.0, 1.0],
-            'strategic_goal': ['Growth', 'CX Efficiency'],
-            'ARR_impact_estimate_USD': [100000, 50000]
-        })
-        sales_data.to_csv(os.path.join(self.data_dir, 'coinbase_advance_internal_sales_notes.csv'), index=False)
-        
-        # Twitter mentions
-        twitter_data = pd.DataFrame({
-            'customer_id': ['twitter_001', 'twitter_002'],
-            'source': ['Twitter', 'Twitter'],
-            'handle': ['@trader1', '@crypto_fan'],
-            'followers': [1000, 5000],
-            'timestamp': ['2024-01-07 16:00:00', '2024-01-08 17:00:00'],
-            'sentiment': ['neutral', 'negative'],
-            'tweet_text': ['Using Coinbase Advanced', 'Issues with the platform'],
-            'theme': ['General Feedback', 'Performance/Outages'],
-            'severity': [1.0, 2.5],
-            'strategic_goal': ['Growth', 'Trust&Safety']
-        })
-        twitter_data.to_csv(os.path.join(self.data_dir, 'coinbase_advanced_twitter_mentions.csv'), index=False)
+    @staticmethod
+    def _write_mock_csvs(data_dir):
+        """
+        Create mock CSV files with valid test data in data_dir.
+        
+        The fixtures stay CSV because the pipeline loads these exact file
+        names; the loader already parses them with pyarrow's CSV reader.
+        """
+        # Build the per-source frames first, then write the files concurrently
+        frames = {
+            filename: MOCK_COMMON_ROWS.iloc[2 * offset:2 * offset + 2].assign(**source_columns)
+            for offset, (filename, source_columns) in enumerate(MOCK_SOURCE_COLUMNS.items())
+        }
+        
+        def write(item):
+            filename, frame = item
+            frame.to_csv(os.path.join(data_dir, filename), index=False, lineterminator='\n')
+        
+        with ThreadPoolExecutor(max_workers=len(frames)) as executor:
+            # Consuming the results re-raises any write error here
+            list(executor.map(write, frames.items()))
     
     def test_environment_validation_success(self):
         """Test successful environment validation."""
@@ -138,7 +189,7 @@ class TestMainPipelineIntegration(unittest.TestCase):
     
     def test_data_loading_and_normalization(self):
         """Test complete data loading and normalization process."""
-        normalized_df = load_and_normalize_data(self.data_dir, self.logger)
+        normalized_df = self._normalized
         
         self.assertIsNotNone(normalized_df)
         self.assertGreater(len(normalized_df), 0)
@@ -155,12 +206,11 @@ class TestMainPipelineIntegration(unittest.TestCase):
     
     def test_nlp_processing_and_scoring(self):
         """Test NLP processing and impact scoring."""
-        # First load and normalize data
-        normalized_df = load_and_normalize_data(self.data_dir, self.logger)
+        # Shared results of load/normalize followed by NLP and scoring
+        normalized_df = self._normalized
         self.assertIsNotNone(normalized_df)
         
-        # Then process with NLP and scoring
-        processed_df = process_nlp_and_scoring(normalized_df, self.logger)
+        processed_df = self._processed
         
         self.assertIsNotNone(processed_df)
         self.assertEqual(len(processed_df), len(normalized_df))
@@ -174,28 +224,31 @@ class TestMainPipelineIntegration(unittest.TestCase):
         self.assertTrue((processed_df['impact_score'] >= 0).all())
     
     def test_report_generation(self):
-        """Test PDF report generation."""
-        # Load, normalize, and process data
-        normalized_df = load_and_normalize_data(self.data_dir, self.logger)
-        processed_df = process_nlp_and_scoring(normalized_df, self.logger)
+        """Test PDF report generation step (rendering is covered end to end)."""
+        # Shared load, normalize, and process results
+        processed_df = self._processed
+        self.assertIsNotNone(processed_df)
         
-        # Generate reports
-        report_results = generate_reports(processed_df, self.output_dir, self.logger)
+        # Generate reports with the PDF renderer stubbed out
+        with patch('main.generate_complete_report', side_effect=_write_stub_report) as mock_report:
+            report_results = generate_reports(processed_df, self.output_dir, self.logger)
         
         # Check report generation results
         self.assertIsInstance(report_results, dict)
-        
-        # If successful, check that PDF file exists
-        if report_results.get('success', False):
-            pdf_path = report_results.get('output_path')
-            self.assertTrue(os.path.exists(pdf_path))
-            self.assertGreater(os.path.getsize(pdf_path), 0)
+        self.assertTrue(report_results['success'])
+        mock_report.assert_called_once()
+        
+        # Check that the report was written into the output directory
+        pdf_path = report_results.get('output_path')
+        self.assertEqual(os.path.dirname(pdf_path), self.output_dir)
+        # One stat call checks both existence and size
+        self.assertGreater(Path(pdf_path).stat().st_size, 0)
     
     def test_dashboard_data_preparation(self):
         """Test dashboard data preparation."""
-        # Load, normalize, and process data
-        normalized_df = load_and_normalize_data(self.data_dir, self.logger)
-        processed_df = process_nlp_and_scoring(normalized_df, self.logger)
+        # Shared load, normalize, and process results
+        processed_df = self._processed
+        self.assertIsNotNone(processed_df)
         
         # Prepare dashboard data
         dashboard_success = prepare_dashboard_data(processed_df, self.output_dir, self.logger)
@@ -204,8 +257,7 @@ class TestMainPipelineIntegration(unittest.TestCase):
         
         # Check that CSV file was created
         csv_path = os.path.join(self.output_dir, 'processed_feedback_data.csv')
-        self.assertTrue(os.path.exists(csv_path))
-        self.assertGreater(os.path.getsize(csv_path), 0)
+        self.assertGreater(Path(csv_path).stat().st_size, 0)
         
         # Verify CSV content
         saved_df = pd.read_csv(csv_path)
@@ -214,11 +266,10 @@ class TestMainPipelineIntegration(unittest.TestCase):
     
     def test_progress_tracker(self):
         """Test progress tracking functionality."""
-        progress_tracker = ProgressTracker(self.logger)
-        
-        # Add test steps
-        progress_tracker.add_step("Test Step 1", "First test step")
-        progress_tracker.add_step("Test Step 2", "Second test step")
+        progress_tracker = self._make_tracker(
+            ("Test Step 1", "First test step"),
+            ("Test Step 2", "Second test step")
+        )
         
         # Start execution
         progress_tracker.start_execution()
@@ -243,7 +294,7 @@ class TestMainPipelineIntegration(unittest.TestCase):
     
     def test_graceful_failure_handling(self):
         """Test graceful failure handling."""
-        progress_tracker = ProgressTracker(self.logger)
+        progress_tracker = self._make_tracker()
         test_error = Exception("Test error for graceful handling")
         
         # Test continuing execution after failure
@@ -258,14 +309,19 @@ class TestMainPipelineIntegration(unittest.TestCase):
         )
         self.assertFalse(stop_exec)
     
-    @patch('sys.argv', ['main.py', '--data-dir', 'test_data', '--output-dir', 'test_output'])
     def test_main_function_with_missing_data(self):
         """Test main function behavior with missing data directory."""
-        with patch('main.validate_environment') as mock_validate:
+        args = argparse.Namespace(data_dir='test_data', output_dir='test_output', verbose=False)
+        
+        # Stub argument parsing and logging setup; only the validation exit path runs
+        with patch('main.parse_arguments', return_value=args), \
+                patch('main.setup_logging', return_value=self.logger), \
+                patch('main.validate_environment') as mock_validate:
             mock_validate.return_value = (False, "Missing data directory")
             
             exit_code = main()
             self.assertEqual(exit_code, 1)
+            mock_validate.assert_called_once_with('test_data', 'test_output')
     
     def test_end_to_end_pipeline_success(self):
         """Test complete end-to-end pipeline execution."""
@@ -278,22 +334,28 @@ class TestMainPipelineIntegration(unittest.TestCase):
             
             # Check that output files were created
             expected_files = [
-                'processed_feedback_data.csv'
+                'processed_feedback_data.csv',
+                'weekly_insight_report.pdf'
             ]
             
+            # List the output directory once and check names against it
+            produced_files = {entry.name for entry in os.scandir(self.output_dir)}
             for filename in expected_files:
-                filepath = os.path.join(self.output_dir, filename)
-                self.assertTrue(os.path.exists(filepath), f"Expected output file not found: {filename}")
+                self.assertIn(filename, produced_files, f"Expected output file not found: {filename}")
     
     def test_pipeline_with_corrupted_data(self):
         """Test pipeline behavior with corrupted CSV data."""
-        # Create a corrupted CSV file
-        corrupted_file = os.path.join(self.data_dir, 'coinbase_advance_apple_reviews.csv')
-        with open(corrupted_file, 'w') as f:
-            f.write("invalid,csv,data\nwith,missing,columns")
+        read_csv_arrow = data_loader._read_csv_arrow
+        
+        def fail_on_ios(file_path, parse_dates):
+            # Simulate a parser failure for the iOS file; read the others normally
+            if os.path.basename(file_path) == 'coinbase_advance_apple_reviews.csv':
+                raise pd.errors.ParserError('simulated corrupted file')
+            return read_csv_arrow(file_path, parse_dates)
         
         # Pipeline should handle this gracefully
-        normalized_df = load_and_normalize_data(self.data_dir, self.logger)
+        with patch('data_processing.data_loader._read_csv_arrow', side_effect=fail_on_ios):
+            normalized_df = load_and_normalize_data(self.data_dir, self.logger)
         
         # Should still work with other valid files
         self.assertIsNotNone(normalized_df)
@@ -302,21 +364,20 @@ class TestMainPipelineIntegration(unittest.TestCase):
     
     def test_pipeline_performance_tracking(self):
         """Test that pipeline tracks performance metrics."""
-        progress_tracker = ProgressTracker(self.logger)
-        progress_tracker.add_step("Performance Test", "Test performance tracking")
-        
-        progress_tracker.start_execution()
-        progress_tracker.start_step(0)
+        progress_tracker = self._make_tracker(("Performance Test", "Test performance tracking"))
         
-        # Simulate some work
-        import time
-        time.sleep(0.1)
-        
-        progress_tracker.complete_step(0, True)
+        # Drive main's clock explicitly: start, step start, step end, summary
+        with patch('main.time') as mock_time:
+            mock_time.time.side_effect = [100.0, 100.0, 100.25, 100.25]
+            
+            progress_tracker.start_execution()
+            progress_tracker.start_step(0)
+            progress_tracker.complete_step(0, True)
+            
+            summary = progress_tracker.get_progress_summary()
         
-        summary = progress_tracker.get_progress_summary()
-        self.assertGreater(summary['total_duration'], 0.1)
-        self.assertGreater(progress_tracker.steps[0]['duration'], 0.1)
+        self.assertAlmostEqual(summary['total_duration'], 0.25)
+        self.assertAlmostEqual(progress_tracker.steps[0]['duration'], 0.25)
 
 
 class TestErrorScenarios(unittest.TestCase):
@@ -326,16 +387,17 @@ class TestErrorScenarios(unittest.TestCase):
     Requirements: 7.5, 7.6
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory for the whole class."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._tmp.cleanup)
+        cls.test_dir = cls._tmp.name
+    
     def setUp(self):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
         self.logger = logging.getLogger(__name__)
     
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
-    
     def test_missing_csv_files(self):
         """Test behavior when CSV files are missing."""
         empty_dir = os.path.join(self.test_dir, 'empty')
@@ -345,6 +407,8 @@ class TestErrorScenarios(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIn('missing files', message.lower())
     
+    @unittest.skipIf(os.name == 'nt', 'chmod semantics differ on Windows')
+    @unittest.skipIf(os.name != 'nt' and os.geteuid() == 0, 'root ignores directory permissions')
     def test_permission_errors(self):
         """Test behavior with permission errors."""
         # Create a directory without write permissions
@@ -371,16 +435,12 @@ class TestErrorScenarios(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add integration tests
-    test_suite.addTest(unittest.makeSuite(TestMainPipelineIntegration))
-    test_suite.addTest(unittest.makeSuite(TestErrorScenarios))
+    # Collect every test class in this module (unittest.makeSuite is deprecated)
+    test_suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(test_suite)
     
     # Exit with appropriate code
-    sys.exit(0 if result.wasSuccessful() else 1)
\ No newline at end of file
+    sys.exit(0 if result.wasSuccessful() else 1)
@@ -10,11 +10,15 @@ Requirements: 8.2, 8.3, 8.4
 """
 
 import unittest
+import csv
 import sys
 import os
 import tempfile
-import shutil
 import json
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import itemgetter
 from unittest.mock import Mock, patch, MagicMock
 
 # Add src directory to path for imports
@@ -22,168 +26,254 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 
+# Mock CSV records per source, built once at import and shared read-only
+_IOS_DATA = [
+    {
+        'customer_id': 'IOS-001',
+        'source': 'iOS App Store',
+        'username': 'user1',
+        'timestamp': '2024-01-01 10:00:00',
+        'rating': '4',
+        'sentiment': 'positive',
+        'review_text': 'Great app!',
+        'theme': 'Performance',
+        'severity': '1.0',
+        'strategic_goal': 'Growth',
+        'helpful_votes': '5'
+    },
+    {
+        'customer_id': 'IOS-002',
+        'source': 'iOS App Store',
+        'username': 'user2',
+        'timestamp': '2024-01-02 11:00:00',
+        'rating': '2',
+        'sentiment': 'negative',
+        'review_text': 'Needs improvement',
+        'theme': 'Trading/Execution & Fees',
+        'severity': '2.0',
+        'strategic_goal': 'CX Efficiency',
+        'helpful_votes': '10'
+    }
+]
+
+_TWITTER_DATA = [
+    {
+        'customer_id': 'TW-001',
+        'source': 'Twitter (X)',
+        'handle': '@trader1',
+        'followers': '148860',
+        'timestamp': '2024-01-05 14:00:00',
+        'sentiment': 'positive',
+        'tweet_text': 'Great trading experience!',
+        'theme': 'Trading/Execution & Fees',
+        'severity': '1.0',
+        'strategic_goal': 'Growth'
+    },
+    {
+        'customer_id': 'TW-002',
+        'source': 'Twitter (X)',
+        'handle': '@trader2',
+        'followers': '106574',
+        'timestamp': '2024-01-06 15:00:00',
+        'sentiment': 'negative',
+        'tweet_text': 'Having issues',
+        'theme': 'Support Experience',
+        'severity': '2.0',
+        'strategic_goal': 'CX Efficiency'
+    }
+]
+
+_SALES_DATA = [
+    {
+        'customer_id': 'SALES-001',
+        'source': 'Internal Sales Notes',
+        'account_name': 'Enterprise Corp',
+        'timestamp': '2024-01-07 16:00:00',
+        'sentiment': 'positive',
+        'note_text': 'Customer very satisfied',
+        'theme': 'Performance',
+        'severity': '1.0',
+        'strategic_goal': 'Growth',
+        'ARR_impact_estimate_USD': '75000'
+    },
+    {
+        'customer_id': 'SALES-002',
+        'source': 'Internal Sales Notes',
+        'account_name': 'Startup Inc',
+        'timestamp': '2024-01-08 17:00:00',
+        'sentiment': 'neutral',
+        'note_text': 'Customer has concerns',
+        'theme': 'Trading/Execution & Fees',
+        'severity': '1.5',
+        'strategic_goal': 'CX Efficiency',
+        'ARR_impact_estimate_USD': '25000'
+    }
+]
+
+MOCK_CSV_DATA = {
+    'ios_reviews': _IOS_DATA,
+    'twitter_mentions': _TWITTER_DATA,
+    'sales_notes': _SALES_DATA
+}
+
+# CSV fixture file name -> mock data source type, in creation order
+MOCK_CSV_FILES = (
+    ('coinbase_advance_apple_reviews.csv', 'ios_reviews'),
+    ('coinbase_advanced_twitter_mentions.csv', 'twitter_mentions'),
+    ('coinbase_advance_internal_sales_notes.csv', 'sales_notes')
+)
+
+# Scoring lookup tables shared by the NLP, scoring and workflow simulations
+_SENTIMENT_VALUES = {'positive': 0.1, 'neutral': 0.5, 'negative': 1.5}
+_VALID_SENTIMENTS = frozenset(_SENTIMENT_VALUES)
+_ALIGNED_GOALS = frozenset({'Growth', 'Trust&Safety', 'Onchain Adoption', 'CX Efficiency', 'Compliance'})
+
+# Source type -> (feedback text field, author handle field, source channel)
+_SOURCE_SPEC = {
+    'ios_reviews': ('review_text', 'username', 'iOS App Store'),
+    'twitter_mentions': ('tweet_text', 'handle', 'Twitter (X)'),
+    'sales_notes': ('note_text', 'account_name', 'Internal Sales Notes')
+}
+
+# Feedback text field -> (author handle field, source channel), for records of unknown type
+_TEXT_FIELDS = {
+    text_field: (handle_field, channel)
+    for text_field, handle_field, channel in _SOURCE_SPEC.values()
+}
+
+# Lower-cased source marker -> (numeric field, divisor) for the source weight
+_WEIGHT_FIELDS = {
+    'internal sales': ('ARR_impact_estimate_USD', 50000),
+    'twitter': ('followers', 20000)
+}
+
+# Numeric fields the workflow simulation scores on, with the value used when absent
+_NUMERIC_DEFAULTS = {'severity': 1.0, 'ARR_impact_estimate_USD': 0, 'followers': 0}
+
+
+def _to_float(value):
+    """Convert a CSV value to float, or None if it is not numeric."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _numeric_columns(records):
+    """Parse each numeric field of records once into a column of floats (None where invalid)."""
+    return {
+        field: [_to_float(record.get(field, default)) for record in records]
+        for field, default in _NUMERIC_DEFAULTS.items()
+    }
+
+
+def _sales_weight(record):
+    """Source weight for sales notes: ARR impact in units of $50k."""
+    arr_impact = _to_float(record.get('ARR_impact_estimate_USD', 0))
+    return 1.0 if arr_impact is None else max(0.1, arr_impact / 50000)
+
+
+def _twitter_weight(record):
+    """Source weight for tweets: followers in units of 20k."""
+    followers = _to_float(record.get('followers', 0))
+    return 1.0 if followers is None else max(0.1, followers / 20000)
+
+
+def _app_store_weight(record):
+    """Source weight for app reviews: rating plus a tenth of the helpful votes."""
+    rating = _to_float(record.get('rating', 0))
+    helpful_votes = _to_float(record.get('helpful_votes', 0))
+    if rating is None or helpful_votes is None:
+        return 1.0
+    return max(0.1, rating + (helpful_votes / 10))
+
+
+# Exact source value -> source weight function; other sources weigh 1.0
+_SOURCE_WEIGHT_FNS = {
+    'Internal Sales Notes': _sales_weight,
+    'Twitter (X)': _twitter_weight,
+    'iOS App Store': _app_store_weight,
+    'Google Play Store': _app_store_weight
+}
+
+
+@dataclass
+class ProcessedRecord:
+    """A scored feedback record produced by the workflow simulation.
+    
+    Slots are declared by hand (rather than ``dataclass(slots=True)``) so the
+    module still runs on Python 3.8.
+    """
+    __slots__ = (
+        'customer_id', 'source', 'timestamp', 'sentiment', 'theme', 'strategic_goal',
+        'feedback_text', 'author_handle', 'source_channel', 'source_weight', 'impact_score'
+    )
+    
+    customer_id: str
+    source: str
+    timestamp: str
+    sentiment: str
+    theme: str
+    strategic_goal: str
+    feedback_text: str
+    author_handle: str
+    source_channel: str
+    source_weight: float
+    impact_score: float
+
+
+def _write_csv(path, rows):
+    """Stream an iterable of same-keyed dicts to CSV with a header row."""
+    rows = iter(rows)
+    first = next(rows, None)
+    with open(path, 'w', newline='', buffering=1 << 16) as f:
+        if first is not None:
+            writer = csv.DictWriter(f, fieldnames=list(first), lineterminator='\n')
+            writer.writeheader()
+            writer.writerow(first)
+            writer.writerows(rows)
+
+
 class MockDataGenerator:
     """Generate mock data for testing without external dependencies."""
     
     @staticmethod
     def create_mock_csv_data():
-        """Create mock CSV data as dictionaries."""
-        ios_data = [
-            {
-                'customer_id': 'IOS-001',
-                'source': 'iOS App Store',
-                'username': 'user1',
-                'timestamp': '2024-01-01 10:00:00',
-                'rating': '4',
-                'sentiment': 'positive',
-                'review_text': 'Great app!',
-                'theme': 'Performance',
-                'severity': '1.0',
-                'strategic_goal': 'Growth',
-                'helpful_votes': '5'
-            },
-            {
-                'customer_id': 'IOS-002',
-                'source': 'iOS App Store',
-                'username': 'user2',
-                'timestamp': '2024-01-02 11:00:00',
-                'rating': '2',
-                'sentiment': 'negative',
-                'review_text': 'Needs improvement',
-                'theme': 'Trading/Execution & Fees',
-                'severity': '2.0',
-                'strategic_goal': 'CX Efficiency',
-                'helpful_votes': '10'
-            }
-        ]
-        
-        twitter_data = [
-            {
-                'customer_id': 'TW-001',
-                'source': 'Twitter (X)',
-                'handle': '@trader1',
-                'followers': '148860',
-                'timestamp': '2024-01-05 14:00:00',
-                'sentiment': 'positive',
-                'tweet_text': 'Great trading experience!',
-                'theme': 'Trading/Execution & Fees',
-                'severity': '1.0',
-                'strategic_goal': 'Growth'
-            },
-            {
-                'customer_id': 'TW-002',
-                'source': 'Twitter (X)',
-                'handle': '@trader2',
-                'followers': '106574',
-                'timestamp': '2024-01-06 15:00:00',
-                'sentiment': 'negative',
-                'tweet_text': 'Having issues',
-                'theme': 'Support Experience',
-                'severity': '2.0',
-                'strategic_goal': 'CX Efficiency'
-            }
-        ]
-        
-        sales_data = [
-            {
-                'customer_id': 'SALES-001',
-                'source': 'Internal Sales Notes',
-                'account_name': 'Enterprise Corp',
-                'timestamp': '2024-01-07 16:00:00',
-                'sentiment': 'positive',
-                'note_text': 'Customer very satisfied',
-                'theme': 'Performance',
-                'severity': '1.0',
-                'strategic_goal': 'Growth',
-                'ARR_impact_estimate_USD': '75000'
-            },
-            {
-                'customer_id': 'SALES-002',
-                'source': 'Internal Sales Notes',
-                'account_name': 'Startup Inc',
-                'timestamp': '2024-01-08 17:00:00',
-                'sentiment': 'neutral',
-                'note_text': 'Customer has concerns',
-                'theme': 'Trading/Execution & Fees',
-                'severity': '1.5',
-                'strategic_goal': 'CX Efficiency',
-                'ARR_impact_estimate_USD': '25000'
-            }
-        ]
-        
-        return {
-            'ios_reviews': ios_data,
-            'twitter_mentions': twitter_data,
-            'sales_notes': sales_data
-        }
+        """Return the shared mock CSV data as dictionaries (read-only; copy before mutating)."""
+        return MOCK_CSV_DATA
     
     @staticmethod
     def create_csv_files(directory):
         """Create actual CSV files in the specified directory."""
         mock_data = MockDataGenerator.create_mock_csv_data()
         
-        # iOS reviews
-        ios_file = os.path.join(directory, 'coinbase_advance_apple_reviews.csv')
-        with open(ios_file, 'w') as f:
-            if mock_data['ios_reviews']:
-                # Write header
-                headers = list(mock_data['ios_reviews'][0].keys())
-                f.write(','.join(headers) + '\n')
-                
-                # Write data
-                for row in mock_data['ios_reviews']:
-                    values = [str(row[header]) for header in headers]
-                    f.write(','.join(values) + '\n')
-        
-        # Twitter mentions
-        twitter_file = os.path.join(directory, 'coinbase_advanced_twitter_mentions.csv')
-        with open(twitter_file, 'w') as f:
-            if mock_data['twitter_mentions']:
-                # Write header
-                headers = list(mock_data['twitter_mentions'][0].keys())
-                f.write(','.join(headers) + '\n')
-                
-                # Write data
-                for row in mock_data['twitter_mentions']:
-                    values = [str(row[header]) for header in headers]
-                    f.write(','.join(values) + '\n')
-        
-        # Sales notes
-        sales_file = os.path.join(directory, 'coinbase_advance_internal_sales_notes.csv')
-        with open(sales_file, 'w') as f:
-            if mock_data['sales_notes']:
-                # Write header
-                headers = list(mock_data['sales_notes'][0].keys())
-                f.write(','.join(headers) + '\n')
-                
-                # Write data
-                for row in mock_data['sales_notes']:
-                    values = [str(row[header]) for header in headers]
-                    f.write(','.join(values) + '\n')
+        file_paths = []
+        for filename, source_type in MOCK_CSV_FILES:
+            file_path = os.path.join(directory, filename)
+            _write_csv(file_path, mock_data[source_type])
+            file_paths.append(file_path)
         
-        return [ios_file, twitter_file, sales_file]
+        return file_paths
 
 
 class TestDataPipelineIntegration(unittest.TestCase):
     """Test integration of data pipeline components."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = os.path.join(self.temp_dir, 'csv_mock_data')
-        self.output_dir = os.path.join(self.temp_dir, 'output')
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once; the mock CSV files are read-only."""
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls.temp_dir = temp_dir.name
+        cls.data_dir = os.path.join(cls.temp_dir, 'csv_mock_data')
+        cls.output_dir = os.path.join(cls.temp_dir, 'output')
         
         # Create directories
-        os.makedirs(self.data_dir, exist_ok=True)
-        os.makedirs(self.output_dir, exist_ok=True)
+        os.makedirs(cls.data_dir, exist_ok=True)
+        os.makedirs(cls.output_dir, exist_ok=True)
         
         # Create mock CSV files
-        self.csv_files = MockDataGenerator.create_csv_files(self.data_dir)
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        cls.csv_files = MockDataGenerator.create_csv_files(cls.data_dir)
     
     def test_csv_file_creation(self):
         """Test that mock CSV files are created correctly."""
@@ -191,14 +281,11 @@ class TestDataPipelineIntegration(unittest.TestCase):
         for csv_file in self.csv_files:
             self.assertTrue(os.path.exists(csv_file), f"CSV file {csv_file} should exist")
             
-            # Verify file has content
-            with open(csv_file, 'r') as f:
-                content = f.read()
-                self.assertGreater(len(content), 0, f"CSV file {csv_file} should have content")
-                
-                # Verify has header and data
-                lines = content.strip().split('\n')
-                self.assertGreater(len(lines), 1, f"CSV file {csv_file} should have header and data")
+            # Verify file has a header line, then at least one data line, streaming past the rest
+            with open(csv_file, 'r', newline='') as f:
+                header = f.readline()
+                self.assertTrue(header.strip(), f"CSV file {csv_file} should have content")
+                self.assertTrue(any(line.strip() for line in f), f"CSV file {csv_file} should have header and data")
     
     def test_data_loading_simulation(self):
         """Test data loading simulation without pandas."""
@@ -206,20 +293,16 @@ class TestDataPipelineIntegration(unittest.TestCase):
             """Simple CSV loader without pandas."""
             data = []
             try:
-                with open(file_path, 'r') as f:
-                    lines = f.readlines()
-                    if len(lines) < 2:
-                        return data
+                with open(file_path, 'r', newline='', buffering=1 << 16) as f:
+                    reader = csv.reader(f)
                     
                     # Parse header
-                    headers = [h.strip() for h in lines[0].strip().split(',')]
+                    headers = next(reader, None)
+                    if headers is None:
+                        return data
                     
                     # Parse data rows
-                    for line in lines[1:]:
-                        values = [v.strip() for v in line.strip().split(',')]
-                        if len(values) == len(headers):
-                            row = dict(zip(headers, values))
-                            data.append(row)
+                    data = [dict(zip(headers, row)) for row in reader if len(row) == len(headers)]
                 
                 return data
             except Exception as e:
@@ -249,25 +332,13 @@ class TestDataPipelineIntegration(unittest.TestCase):
         """Test data normalization simulation."""
         def normalize_feedback_text(record, source_type):
             """Normalize feedback text based on source type."""
-            if source_type == 'ios_reviews' and 'review_text' in record:
-                return record['review_text']
-            elif source_type == 'twitter_mentions' and 'tweet_text' in record:
-                return record['tweet_text']
-            elif source_type == 'sales_notes' and 'note_text' in record:
-                return record['note_text']
-            else:
-                return ''
+            spec = _SOURCE_SPEC.get(source_type)
+            return record.get(spec[0], '') if spec is not None else ''
         
         def normalize_author_handle(record, source_type):
             """Normalize author handle based on source type."""
-            if source_type == 'ios_reviews' and 'username' in record:
-                return record['username']
-            elif source_type == 'twitter_mentions' and 'handle' in record:
-                return record['handle']
-            elif source_type == 'sales_notes' and 'account_name' in record:
-                return record['account_name']
-            else:
-                return ''
+            spec = _SOURCE_SPEC.get(source_type)
+            return record.get(spec[1], '') if spec is not None else ''
         
         # Load mock data
         mock_data = MockDataGenerator.create_mock_csv_data()
@@ -292,7 +363,7 @@ class TestDataPipelineIntegration(unittest.TestCase):
         def extract_sentiment(record):
             """Extract sentiment from record."""
             sentiment = record.get('sentiment', '').lower().strip()
-            if sentiment in ['positive', 'negative', 'neutral']:
+            if sentiment in _VALID_SENTIMENTS:
                 return sentiment
             else:
                 return 'neutral'
@@ -308,8 +379,7 @@ class TestDataPipelineIntegration(unittest.TestCase):
         def extract_strategic_goal(record):
             """Extract strategic goal from record."""
             goal = record.get('strategic_goal', '').strip()
-            valid_goals = ['Growth', 'Trust&Safety', 'Onchain Adoption', 'CX Efficiency', 'Compliance']
-            if goal in valid_goals:
+            if goal in _ALIGNED_GOALS:
                 return goal
             else:
                 return 'General'
@@ -317,25 +387,22 @@ class TestDataPipelineIntegration(unittest.TestCase):
         # Load mock data
         mock_data = MockDataGenerator.create_mock_csv_data()
         
-        # Test NLP processing for each record
-        total_processed = 0
-        for source_type, records in mock_data.items():
-            for record in records:
-                # Test sentiment extraction
-                sentiment = extract_sentiment(record)
-                self.assertIn(sentiment, ['positive', 'negative', 'neutral'])
-                
-                # Test theme extraction
-                theme = extract_theme(record)
-                self.assertIsInstance(theme, str)
-                self.assertGreater(len(theme), 0)
-                
-                # Test strategic goal extraction
-                strategic_goal = extract_strategic_goal(record)
-                self.assertIsInstance(strategic_goal, str)
-                self.assertGreater(len(strategic_goal), 0)
-                
-                total_processed += 1
+        # Extract every field first, then check each property once across all records
+        extracted = [
+            (record.get('customer_id'), extract_sentiment(record), extract_theme(record), extract_strategic_goal(record))
+            for records in mock_data.values()
+            for record in records
+        ]
+        total_processed = len(extracted)
+        
+        bad_sentiments = [(cid, sentiment) for cid, sentiment, _, _ in extracted if sentiment not in _VALID_SENTIMENTS]
+        self.assertFalse(bad_sentiments, f"Bad sentiments: {bad_sentiments}")
+        
+        bad_themes = [(cid, theme) for cid, _, theme, _ in extracted if not (isinstance(theme, str) and theme)]
+        self.assertFalse(bad_themes, f"Bad themes: {bad_themes}")
+        
+        bad_goals = [(cid, goal) for cid, _, _, goal in extracted if not (isinstance(goal, str) and goal)]
+        self.assertFalse(bad_goals, f"Bad strategic goals: {bad_goals}")
         
         print(f"✅ NLP processing simulation completed for {total_processed} records")
     
@@ -343,47 +410,13 @@ class TestDataPipelineIntegration(unittest.TestCase):
         """Test scoring integration simulation."""
         def calculate_source_weight_simple(record):
             """Calculate source weight based on record."""
-            source = record.get('source', '').lower()
-            
-            if 'internal sales' in source:
-                try:
-                    arr_impact = float(record.get('ARR_impact_estimate_USD', 0))
-                    weight = arr_impact / 50000
-                    return max(0.1, weight)
-                except (ValueError, TypeError):
-                    return 1.0
-            
-            elif 'twitter' in source:
-                try:
-                    followers = float(record.get('followers', 0))
-                    weight = followers / 20000
-                    return max(0.1, weight)
-                except (ValueError, TypeError):
-                    return 1.0
-            
-            elif 'app store' in source or 'play' in source:
-                try:
-                    rating = float(record.get('rating', 0))
-                    helpful_votes = float(record.get('helpful_votes', 0))
-                    weight = rating + (helpful_votes / 10)
-                    return max(0.1, weight)
-                except (ValueError, TypeError):
-                    return 1.0
-            
-            else:
-                return 1.0
+            weight_fn = _SOURCE_WEIGHT_FNS.get(record.get('source', ''))
+            return weight_fn(record) if weight_fn is not None else 1.0
         
         def calculate_impact_score_simple(record, source_weight):
             """Calculate impact score."""
-            # Sentiment values
-            sentiment_values = {
-                'positive': 0.1,
-                'neutral': 0.5,
-                'negative': 1.5
-            }
-            
             sentiment = record.get('sentiment', 'neutral').lower()
-            sentiment_value = sentiment_values.get(sentiment, 0.5)
+            sentiment_value = _SENTIMENT_VALUES.get(sentiment, 0.5)
             
             try:
                 severity = float(record.get('severity', 1.0))
@@ -392,8 +425,7 @@ class TestDataPipelineIntegration(unittest.TestCase):
             
             # Strategic multiplier
             strategic_goal = record.get('strategic_goal', '')
-            aligned_goals = ['Growth', 'Trust&Safety', 'Onchain Adoption', 'CX Efficiency', 'Compliance']
-            strategic_multiplier = 2.0 if strategic_goal in aligned_goals else 1.0
+            strategic_multiplier = 2.0 if strategic_goal in _ALIGNED_GOALS else 1.0
             
             # Calculate impact score
             impact_score = (sentiment_value * severity) * source_weight * strategic_multiplier
@@ -403,21 +435,26 @@ class TestDataPipelineIntegration(unittest.TestCase):
         # Load mock data
         mock_data = MockDataGenerator.create_mock_csv_data()
         
-        # Test scoring for each record
-        total_scored = 0
-        for source_type, records in mock_data.items():
+        # Score every record first, then check each property once across all records
+        scored = []
+        for records in mock_data.values():
             for record in records:
-                # Calculate source weight
                 source_weight = calculate_source_weight_simple(record)
-                self.assertIsInstance(source_weight, (int, float))
-                self.assertGreater(source_weight, 0)
-                
-                # Calculate impact score
                 impact_score = calculate_impact_score_simple(record, source_weight)
-                self.assertIsInstance(impact_score, (int, float))
-                self.assertGreaterEqual(impact_score, 0)
-                
-                total_scored += 1
+                scored.append((record.get('customer_id'), source_weight, impact_score))
+        total_scored = len(scored)
+        
+        bad_weights = [
+            (cid, weight) for cid, weight, _ in scored
+            if not (isinstance(weight, (int, float)) and weight > 0)
+        ]
+        self.assertFalse(bad_weights, f"Bad source weights: {bad_weights}")
+        
+        bad_impacts = [
+            (cid, impact) for cid, _, impact in scored
+            if not (isinstance(impact, (int, float)) and impact >= 0)
+        ]
+        self.assertFalse(bad_impacts, f"Bad impact scores: {bad_impacts}")
         
         print(f"✅ Scoring integration completed for {total_scored} records")
 
@@ -425,57 +462,52 @@ class TestDataPipelineIntegration(unittest.TestCase):
 class TestEndToEndWorkflowSimulation(unittest.TestCase):
     """Test end-to-end workflow simulation."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once; each test writes under its own output directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls.temp_dir = temp_dir.name
+    
     def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = os.path.join(self.temp_dir, 'csv_mock_data')
-        self.output_dir = os.path.join(self.temp_dir, 'output')
-        
-        # Create directories
-        os.makedirs(self.data_dir, exist_ok=True)
+        """Give each test its own output directory."""
+        self.output_dir = os.path.join(self.temp_dir, 'output', self._testMethodName)
         os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Create mock CSV files
-        self.csv_files = MockDataGenerator.create_csv_files(self.data_dir)
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
     
     def test_complete_workflow_simulation(self):
         """Test complete end-to-end workflow simulation."""
         # Step 1: Data Loading
-        def load_all_data(data_directory):
-            """Load all CSV data from directory."""
+        def load_all_data(source):
+            """Load all CSV data from a directory, or pass already-loaded records through."""
+            if isinstance(source, dict):
+                return source
+            
             all_data = {}
             
-            for filename in os.listdir(data_directory):
-                if filename.endswith('.csv'):
-                    file_path = os.path.join(data_directory, filename)
+            with os.scandir(source) as entries:
+                for entry in entries:
+                    if not (entry.name.endswith('.csv') and entry.is_file()):
+                        continue
+                    
                     data = []
                     
                     try:
-                        with open(file_path, 'r') as f:
-                            lines = f.readlines()
-                            if len(lines) < 2:
-                                continue
+                        with open(entry.path, 'r', newline='', buffering=1 << 16) as f:
+                            reader = csv.reader(f)
                             
                             # Parse header
-                            headers = [h.strip() for h in lines[0].strip().split(',')]
+                            headers = next(reader, None)
+                            if headers is None:
+                                continue
                             
                             # Parse data rows
-                            for line in lines[1:]:
-                                values = [v.strip() for v in line.strip().split(',')]
-                                if len(values) == len(headers):
-                                    row = dict(zip(headers, values))
-                                    data.append(row)
+                            data = [dict(zip(headers, row)) for row in reader if len(row) == len(headers)]
                         
                         if data:
-                            all_data[filename] = data
+                            all_data[entry.name] = data
                     
                     except Exception as e:
-                        print(f"Error loading {filename}: {e}")
+                        print(f"Error loading {entry.name}: {e}")
             
             return all_data
         
@@ -485,61 +517,57 @@ class TestEndToEndWorkflowSimulation(unittest.TestCase):
             processed_records = []
             
             for filename, records in loaded_data.items():
-                for record in records:
-                    # Normalize data
-                    processed_record = record.copy()
-                    
-                    # Add normalized fields
-                    if 'review_text' in record:
-                        processed_record['feedback_text'] = record['review_text']
-                        processed_record['author_handle'] = record.get('username', '')
-                        processed_record['source_channel'] = 'iOS App Store'
-                    elif 'tweet_text' in record:
-                        processed_record['feedback_text'] = record['tweet_text']
-                        processed_record['author_handle'] = record.get('handle', '')
-                        processed_record['source_channel'] = 'Twitter (X)'
-                    elif 'note_text' in record:
-                        processed_record['feedback_text'] = record['note_text']
-                        processed_record['author_handle'] = record.get('account_name', '')
-                        processed_record['source_channel'] = 'Internal Sales Notes'
-                    
-                    # Calculate source weight
+                # Parse the numeric fields of this file once, column by column
+                numeric = _numeric_columns(records)
+                
+                for row, record in enumerate(records):
+                    # Read the discriminating fields once
                     source = record.get('source', '').lower()
-                    if 'internal sales' in source:
-                        try:
-                            arr_impact = float(record.get('ARR_impact_estimate_USD', 0))
-                            source_weight = max(0.1, arr_impact / 50000)
-                        except (ValueError, TypeError):
-                            source_weight = 1.0
-                    elif 'twitter' in source:
-                        try:
-                            followers = float(record.get('followers', 0))
-                            source_weight = max(0.1, followers / 20000)
-                        except (ValueError, TypeError):
-                            source_weight = 1.0
-                    else:
-                        source_weight = 1.0
+                    sentiment = record.get('sentiment', 'neutral').lower()
+                    
+                    # Normalized fields from the first text field present
+                    feedback_text = author_handle = source_channel = ''
+                    for text_field, (handle_field, channel) in _TEXT_FIELDS.items():
+                        if text_field in record:
+                            feedback_text = record[text_field]
+                            author_handle = record.get(handle_field, '')
+                            source_channel = channel
+                            break
                     
-                    processed_record['source_weight'] = source_weight
+                    # Calculate source weight from the first matching source marker
+                    source_weight = 1.0
+                    for marker, (weight_field, divisor) in _WEIGHT_FIELDS.items():
+                        if marker in source:
+                            weight_value = numeric[weight_field][row]
+                            if weight_value is not None:
+                                source_weight = max(0.1, weight_value / divisor)
+                            break
                     
                     # Calculate impact score
-                    sentiment_values = {'positive': 0.1, 'neutral': 0.5, 'negative': 1.5}
-                    sentiment = record.get('sentiment', 'neutral').lower()
-                    sentiment_value = sentiment_values.get(sentiment, 0.5)
+                    sentiment_value = _SENTIMENT_VALUES.get(sentiment, 0.5)
                     
-                    try:
-                        severity = float(record.get('severity', 1.0))
-                    except (ValueError, TypeError):
+                    severity = numeric['severity'][row]
+                    if severity is None:
                         severity = 1.0
                     
                     strategic_goal = record.get('strategic_goal', '')
-                    aligned_goals = ['Growth', 'Trust&Safety', 'Onchain Adoption', 'CX Efficiency', 'Compliance']
-                    strategic_multiplier = 2.0 if strategic_goal in aligned_goals else 1.0
+                    strategic_multiplier = 2.0 if strategic_goal in _ALIGNED_GOALS else 1.0
                     
                     impact_score = (sentiment_value * severity) * source_weight * strategic_multiplier
-                    processed_record['impact_score'] = max(0.0, impact_score)
                     
-                    processed_records.append(processed_record)
+                    processed_records.append(ProcessedRecord(
+                        customer_id=record.get('customer_id', ''),
+                        source=record.get('source', ''),
+                        timestamp=record.get('timestamp', ''),
+                        sentiment=record.get('sentiment', 'neutral'),
+                        theme=record.get('theme', 'General Feedback'),
+                        strategic_goal=strategic_goal,
+                        feedback_text=feedback_text,
+                        author_handle=author_handle,
+                        source_channel=source_channel,
+                        source_weight=source_weight,
+                        impact_score=max(0.0, impact_score)
+                    ))
             
             return processed_records
         
@@ -549,46 +577,43 @@ class TestEndToEndWorkflowSimulation(unittest.TestCase):
             if not processed_records:
                 return {}
             
-            # Calculate summary statistics
-            total_records = len(processed_records)
-            
-            # Sentiment distribution
+            # Sentiment distribution, theme totals and overall impact in one pass
             sentiment_counts = {'positive': 0, 'neutral': 0, 'negative': 0}
+            theme_totals = defaultdict(float)
+            total_impact = 0.0
             for record in processed_records:
-                sentiment = record.get('sentiment', 'neutral').lower()
+                sentiment = record.sentiment.lower()
                 if sentiment in sentiment_counts:
                     sentiment_counts[sentiment] += 1
+                theme_totals[record.theme] += record.impact_score
+                total_impact += record.impact_score
             
-            # Top themes by impact
-            theme_impacts = {}
-            for record in processed_records:
-                theme = record.get('theme', 'General Feedback')
-                impact = record.get('impact_score', 0)
-                if theme not in theme_impacts:
-                    theme_impacts[theme] = []
-                theme_impacts[theme].append(impact)
-            
-            # Calculate theme totals
-            theme_totals = {}
-            for theme, impacts in theme_impacts.items():
-                theme_totals[theme] = sum(impacts)
-            
-            # Sort themes by total impact
-            top_themes = sorted(theme_totals.items(), key=lambda x: x[1], reverse=True)
+            # Top three themes by total impact
+            top_themes = heapq.nlargest(3, theme_totals.items(), key=itemgetter(1))
             
             return {
-                'total_records': total_records,
+                'total_records': len(processed_records),
                 'sentiment_distribution': sentiment_counts,
-                'top_themes': top_themes[:3],
-                'total_impact': sum(record.get('impact_score', 0) for record in processed_records)
+                'top_themes': top_themes,
+                'total_impact': total_impact
             }
         
         # Execute complete workflow
         print("🚀 Starting end-to-end workflow simulation...")
         
-        # Step 1: Load data
-        loaded_data = load_all_data(self.data_dir)
+        # Step 1: Load data from memory; the directory path must yield the same records
+        mock_data = MockDataGenerator.create_mock_csv_data()
+        loaded_data = load_all_data(mock_data)
         self.assertGreater(len(loaded_data), 0, "Should load data files")
+        
+        data_dir = os.path.join(self.output_dir, 'csv_mock_data')
+        os.makedirs(data_dir, exist_ok=True)
+        MockDataGenerator.create_csv_files(data_dir)
+        self.assertEqual(
+            load_all_data(data_dir),
+            {filename: mock_data[source_type] for filename, source_type in MOCK_CSV_FILES},
+            "Directory loading should round-trip the mock records"
+        )
         print(f"✅ Step 1: Loaded {len(loaded_data)} data files")
         
         # Step 2: Process data
@@ -596,13 +621,11 @@ class TestEndToEndWorkflowSimulation(unittest.TestCase):
         self.assertGreater(len(processed_records), 0, "Should process records")
         print(f"✅ Step 2: Processed {len(processed_records)} records")
         
-        # Verify processed records have required fields
-        for record in processed_records:
-            self.assertIn('feedback_text', record)
-            self.assertIn('author_handle', record)
-            self.assertIn('source_channel', record)
-            self.assertIn('source_weight', record)
-            self.assertIn('impact_score', record)
+        # Verify every record was normalized from a known text field and scored
+        unnormalized = [record.customer_id for record in processed_records if not record.source_channel]
+        self.assertFalse(unnormalized, f"Records without a recognised text field: {unnormalized}")
+        self.assertTrue(all(record.source_weight > 0 for record in processed_records))
+        self.assertTrue(all(record.impact_score >= 0 for record in processed_records))
         
         # Step 3: Generate report
         report_summary = generate_report_summary(processed_records)
@@ -613,8 +636,8 @@ class TestEndToEndWorkflowSimulation(unittest.TestCase):
         
         # Step 4: Save results
         output_file = os.path.join(self.output_dir, 'workflow_results.json')
-        with open(output_file, 'w') as f:
-            json.dump(report_summary, f, indent=2)
+        with open(output_file, 'w', buffering=1 << 16) as f:
+            f.write(json.dumps(report_summary, indent=2))
         
         self.assertTrue(os.path.exists(output_file), "Should create output file")
         print(f"✅ Step 4: Saved results to {output_file}")
@@ -633,13 +656,10 @@ class TestErrorHandlingIntegration(unittest.TestCase):
     """Test error handling in integration scenarios."""
     
     def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        """Set up test environment; cleanup runs even if the test errors."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
     
     def test_missing_data_directory_handling(self):
         """Test handling of missing data directory."""